@@ -257,6 +257,11 @@ def _connect() -> duckdb.DuckDBPyConnection:
     con.execute(f"SET home_directory='{HOME_DIRECTORY.replace(chr(39), chr(39) * 2)}'")
     con.execute("INSTALL httpfs")
     con.execute("LOAD httpfs")
+    # Creating the views binds them, which already fetches each file's HEAD
+    # and parquet footer; cache both so the tool's own query reuses them
+    # instead of repeating those round trips to R2.
+    con.execute("SET enable_http_metadata_cache=true")
+    con.execute("SET parquet_metadata_cache=true")
 
     # Optionally attach the Iceberg catalog (before the config lock) so the
     # comments view can be served from it.
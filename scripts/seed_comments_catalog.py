@@ -118,7 +118,7 @@ def main() -> int:
 
     bucket = getenv("R2_BUCKET_NAME", "spicy-regs")
 
-    con = iceberg._connect()  # iceberg + httpfs loaded, catalog attached
+    con = iceberg._connect(args.output_dir / ".duckdb_tmp")  # iceberg + httpfs loaded, catalog attached
     try:
         _create_s3_secret(con)
         iceberg._ensure_table(con, COMMENT)
@@ -9,16 +9,39 @@ Usage:
     uvx spicy-regs search "climate"   # Search across datasets
 """
 
+from __future__ import annotations
+
 import argparse
+import random
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import urlretrieve
-from urllib.error import URLError
+from typing import TYPE_CHECKING
+
+# Heavy imports (httpx, polars, duckdb, pyarrow) happen inside the commands
+# that need them, so `--help` and argument errors return without loading them.
+if TYPE_CHECKING:
+    import httpx
 
 # Public URL for the R2 bucket
 PUBLIC_URL = "https://r2.spicy-regs.dev"
 DATA_TYPES = ["dockets", "documents", "comments", "manifest"]
 DEFAULT_OUTPUT_DIR = Path("./spicy-regs-data")
+# Stream downloads in 1 MiB chunks; the parquet files run to hundreds of MB.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = 60.0
+DOWNLOAD_CONNECT_TIMEOUT = 10.0
+
+
+def _download_client(max_connections: int = 8) -> httpx.Client:
+    import httpx
+
+    return httpx.Client(
+        follow_redirects=True,
+        timeout=httpx.Timeout(DOWNLOAD_TIMEOUT, connect=DOWNLOAD_CONNECT_TIMEOUT),
+        limits=httpx.Limits(max_connections=max_connections),
+    )
 
 
 def get_output_dir(args) -> Path:
@@ -28,8 +51,16 @@ def get_output_dir(args) -> Path:
     return output_dir
 
 
-def download_file(name: str, output_dir: Path, force: bool = False) -> Path | None:
-    """Download a parquet file from R2."""
+def download_file(name: str, output_dir: Path, force: bool = False, client: httpx.Client | None = None) -> Path | None:
+    """Download a parquet file from R2.
+
+    Streams to ``{name}.parquet.tmp`` and renames into place only once the
+    byte count matches ``Content-Length``, so an interrupted download never
+    leaves a truncated file that looks complete.
+    Pass a shared ``client`` to reuse its connection pool across files.
+    """
+    import httpx
+
     url = f"{PUBLIC_URL}/{name}.parquet"
     local_path = output_dir / f"{name}.parquet"
 
@@ -39,14 +70,34 @@ def download_file(name: str, output_dir: Path, force: bool = False) -> Path | No
         return local_path
 
     print(f"  ⬇ Downloading {name}.parquet...")
+    temp_path = local_path.with_suffix(".parquet.tmp")
+    owns_client = client is None
+    client = client or _download_client()
     try:
-        urlretrieve(url, local_path)
+        with client.stream("GET", url) as response:
+            response.raise_for_status()
+            written = 0
+            with open(temp_path, "wb") as f:
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+            # Reject a body cut short instead of renaming it into place.
+            # Content-Length counts encoded bytes, so skip the check if the
+            # server compressed the response.
+            expected = response.headers.get("Content-Length")
+            if expected is not None and "Content-Encoding" not in response.headers and written != int(expected):
+                raise httpx.ReadError(f"received {written} of {expected} bytes", request=response.request)
+        temp_path.replace(local_path)
         size_mb = local_path.stat().st_size / (1024 * 1024)
         print(f"  ✓ {name}.parquet ({size_mb:.1f} MB)")
         return local_path
-    except URLError as e:
+    except httpx.HTTPError as e:
+        temp_path.unlink(missing_ok=True)
         print(f"  ✗ Failed to download {name}.parquet: {e}")
         return None
+    finally:
+        if owns_client:
+            client.close()
 
 
 def cmd_download(args):
@@ -56,8 +107,16 @@ def cmd_download(args):
 
     types_to_download = args.types if args.types else ["dockets", "documents", "comments"]
 
-    for data_type in types_to_download:
-        download_file(data_type, output_dir, force=args.force)
+    # The files are independent, so fetch them concurrently over one pooled
+    # client instead of opening a fresh connection per file in sequence.
+    with _download_client() as client:
+        with ThreadPoolExecutor(max_workers=len(types_to_download)) as executor:
+            list(
+                executor.map(
+                    lambda data_type: download_file(data_type, output_dir, force=args.force, client=client),
+                    types_to_download,
+                )
+            )
 
     print(f"\nDone! Data saved to: {output_dir.absolute()}")
 
@@ -65,9 +124,10 @@ def cmd_download(args):
 def cmd_stats(args):
     """Show statistics for downloaded datasets."""
     try:
-        import polars as pl
+        import duckdb
+        import pyarrow.parquet as pq
     except ImportError:
-        print("Please install polars: pip install polars")
+        print("Please install duckdb and pyarrow: pip install duckdb pyarrow")
         sys.exit(1)
 
     output_dir = get_output_dir(args)
@@ -82,21 +142,33 @@ def cmd_stats(args):
             print(f"\n{data_type.upper()}: Not downloaded yet (run: spicy-regs download)")
             continue
 
-        df = pl.read_parquet(parquet_file)
+        # Row count and column names live in the Parquet footer — no need to
+        # decode the (large) text columns just to report them.
+        pf = pq.ParquetFile(parquet_file)
+        columns = pf.schema_arrow.names
         size_mb = parquet_file.stat().st_size / (1024 * 1024)
 
         print(f"\n{data_type.upper()} ({size_mb:.1f} MB)")
         print("-" * 40)
-        print(f"  Rows: {len(df):,}")
-        print(f"  Columns: {', '.join(df.columns)}")
-
-        # Agency breakdown
-        if "agency_code" in df.columns:
-            agency_counts = df.group_by("agency_code").len().sort("len", descending=True)
-            top_agencies = agency_counts.head(5)
+        print(f"  Rows: {pf.metadata.num_rows:,}")
+        print(f"  Columns: {', '.join(columns)}")
+
+        # Agency breakdown — DuckDB scans just the agency_code column and
+        # aggregates it vectorized, returning only the top five rows.
+        if "agency_code" in columns:
+            top_agencies = duckdb.execute(
+                """
+                SELECT agency_code, COUNT(*) AS n
+                FROM read_parquet(?)
+                GROUP BY agency_code
+                ORDER BY n DESC
+                LIMIT 5
+                """,
+                [str(parquet_file)],
+            ).fetchall()
             print("  Top agencies:")
-            for row in top_agencies.iter_rows():
-                print(f"    {row[0]}: {row[1]:,}")
+            for agency, count in top_agencies:
+                print(f"    {agency}: {count:,}")
 
 
 def cmd_sample(args):
@@ -115,14 +187,29 @@ def cmd_sample(args):
         print("Run: spicy-regs download")
         sys.exit(1)
 
-    df = pl.read_parquet(parquet_file)
-
+    lf = pl.scan_parquet(parquet_file)
     if args.agency:
-        df = df.filter(pl.col("agency_code") == args.agency)
-
-    sample = df.sample(min(args.n, len(df)))
-
-    print(f"\nSample from {args.data_type} ({len(df):,} total rows):")
+        # Count and sample the matching rows in one pass that decodes only the
+        # agency_code column; just the picked positions come back to Python.
+        stats = (
+            lf.with_row_index("_row")
+            .filter(pl.col("agency_code") == args.agency)
+            .select(
+                pl.len().alias("total"),
+                pl.col("_row").sample(pl.min_horizontal(pl.len(), args.n)).implode().alias("picked"),
+            )
+            .collect(engine="streaming")
+        )
+        total = stats["total"].item()
+        picked = stats["picked"].item().to_list()
+    else:
+        total = lf.select(pl.len()).collect().item()
+        picked = random.sample(range(total), min(args.n, total))
+
+    # Fetch the sampled rows in a single scan filtered on their positions.
+    sample = lf.with_row_index("_row").filter(pl.col("_row").is_in(picked)).drop("_row").collect()
+
+    print(f"\nSample from {args.data_type} ({total:,} total rows):")
     print("=" * 80)
     print(sample)
 
@@ -136,7 +223,9 @@ def cmd_search(args):
         sys.exit(1)
 
     output_dir = get_output_dir(args)
-    query = args.query.lower()
+    # One case-insensitive regex pass, instead of lower-casing every column
+    # into a fresh buffer before a literal match.
+    pattern = f"(?i){re.escape(args.query)}"
 
     print(f"Searching for: '{args.query}'")
     print("=" * 60)
@@ -152,25 +241,27 @@ def cmd_search(args):
         if not parquet_file.exists():
             continue
 
-        df = pl.read_parquet(parquet_file)
-
-        # Build filter for any column containing the query
-        filters = None
-        for col in columns:
-            if col in df.columns:
-                col_filter = pl.col(col).str.to_lowercase().str.contains(query, literal=True)
-                filters = col_filter if filters is None else (filters | col_filter)
-
-        if filters is not None:
-            matches = df.filter(filters)
-            if len(matches) > 0:
-                print(f"\n{data_type.upper()}: {len(matches):,} matches")
-                print("-" * 40)
-                sample = matches.head(args.limit)
-                for row in sample.iter_rows(named=True):
-                    id_col = list(row.keys())[0]
-                    title = row.get("title", "")[:80] if row.get("title") else "(no title)"
-                    print(f"  {row[id_col]}: {title}")
+        # Lazy scan: only the searched and displayed columns are decoded.
+        lf = pl.scan_parquet(parquet_file)
+        file_columns = lf.collect_schema().names()
+        search_columns = [col for col in columns if col in file_columns]
+        if not search_columns:
+            continue
+
+        id_col = file_columns[0]
+        display_columns = [id_col] + (["title"] if "title" in file_columns and id_col != "title" else [])
+        matches = (
+            lf.filter(pl.any_horizontal(pl.col(col).str.contains(pattern) for col in search_columns))
+            .select(display_columns)
+            .collect(engine="streaming")
+        )
+        if len(matches) > 0:
+            print(f"\n{data_type.upper()}: {len(matches):,} matches")
+            print("-" * 40)
+            sample = matches.head(args.limit)
+            for row in sample.iter_rows(named=True):
+                title = row.get("title", "")[:80] if row.get("title") else "(no title)"
+                print(f"  {row[id_col]}: {title}")
 
 
 def cmd_agencies(args):
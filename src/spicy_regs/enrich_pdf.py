@@ -27,12 +27,13 @@ import argparse
 import json
 from collections.abc import Callable, Mapping
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import polars as pl
 from loguru import logger
 
-from spicy_regs.sources.pdf import fetch_pdf_bytes
+from spicy_regs.sources.pdf import fetch_pdf_bytes, pdf_client
 from spicy_regs.transforms.pdf_text import (
     PAGE_SEPARATOR,
     PdfTextResult,
@@ -279,10 +280,14 @@ def enrich_documents_parquet(
     """Read ``documents.parquet``, enrich it in place, and write it back."""
     if not documents_path.exists():
         raise FileNotFoundError(f"{documents_path} not found; run the ETL first")
-    return _enrich_parquet_file(
-        documents_path,
-        lambda df: enrich_documents_with_pdf_text(df, limit=limit, max_workers=max_workers, overwrite=overwrite),
-    )
+    with pdf_client(max_connections=max_workers) as client:
+        fetch = partial(fetch_pdf_bytes, client=client)
+        return _enrich_parquet_file(
+            documents_path,
+            lambda df: enrich_documents_with_pdf_text(
+                df, fetch=fetch, limit=limit, max_workers=max_workers, overwrite=overwrite
+            ),
+        )
 
 
 def enrich_comments_parquet(
@@ -295,10 +300,14 @@ def enrich_comments_parquet(
     """Read a single comments Parquet file, enrich it in place, write it back."""
     if not comments_path.exists():
         raise FileNotFoundError(f"{comments_path} not found; run the ETL first")
-    return _enrich_parquet_file(
-        comments_path,
-        lambda df: enrich_comments_with_pdf_text(df, limit=limit, max_workers=max_workers, overwrite=overwrite),
-    )
+    with pdf_client(max_connections=max_workers) as client:
+        fetch = partial(fetch_pdf_bytes, client=client)
+        return _enrich_parquet_file(
+            comments_path,
+            lambda df: enrich_comments_with_pdf_text(
+                df, fetch=fetch, limit=limit, max_workers=max_workers, overwrite=overwrite
+            ),
+        )
 
 
 def enrich_comment_partitions(
@@ -320,18 +329,24 @@ def enrich_comment_partitions(
 
     totals = {"selected": 0, "ok": 0, "empty": 0, "encrypted": 0, "error": 0}
     remaining = limit
-    for part in parts:
-        if remaining is not None and remaining <= 0:
-            logger.info("Reached --limit budget; {} partitions left unprocessed", len(parts) - parts.index(part))
-            break
-        stats = _enrich_parquet_file(
-            part,
-            lambda df: enrich_comments_with_pdf_text(df, limit=remaining, max_workers=max_workers, overwrite=overwrite),
-        )
-        for k, v in stats.items():
-            totals[k] += v
-        if remaining is not None:
-            remaining -= stats["selected"]
+    # One pool for the whole run: partitions mostly hit the same attachment
+    # host, so connections (and TLS sessions) carry over between agencies.
+    with pdf_client(max_connections=max_workers) as client:
+        fetch = partial(fetch_pdf_bytes, client=client)
+        for part in parts:
+            if remaining is not None and remaining <= 0:
+                logger.info("Reached --limit budget; {} partitions left unprocessed", len(parts) - parts.index(part))
+                break
+            stats = _enrich_parquet_file(
+                part,
+                lambda df: enrich_comments_with_pdf_text(
+                    df, fetch=fetch, limit=remaining, max_workers=max_workers, overwrite=overwrite
+                ),
+            )
+            for k, v in stats.items():
+                totals[k] += v
+            if remaining is not None:
+                remaining -= stats["selected"]
 
     logger.info("Comment partition enrichment totals: {}", totals)
     return totals
@@ -4,7 +4,6 @@ Generate pre-computed analytics JSON files from Parquet data.
 These are uploaded to R2 alongside the Parquet files for fast frontend access.
 """
 
-import json
 from pathlib import Path
 import duckdb
 
@@ -12,13 +11,40 @@ import duckdb
 R2_BASE_URL = "https://r2.spicy-regs.dev"
 
 
-def generate_analytics(parquet_dir: Path | None = None, output_dir: Path | None = None) -> dict[str, Path]:
+def _profile_to(conn: duckdb.DuckDBPyConnection, profile_dir: Path | None, name: str) -> None:
+    """Send the next statement's profile to ``{profile_dir}/{name}.json`` (no-op without a dir)."""
+    if profile_dir:
+        profile = str(profile_dir / f"{name}.json").replace("'", "''")
+        conn.execute(f"SET profiling_output='{profile}'")
+
+
+def _copy_json(conn: duckdb.DuckDBPyConnection, query: str, path: Path, profile_dir: Path | None = None) -> Path:
+    """Write the rows of ``query`` to ``path`` as a JSON array of objects.
+
+    DuckDB serializes the result itself, so rows are never materialized as
+    Python tuples/dicts on the way to disk. With ``profile_dir``, the query's
+    profile is written to ``{profile_dir}/{path.stem}.json``.
+    """
+    _profile_to(conn, profile_dir, path.stem)
+    target = str(path).replace("'", "''")
+    (rows,) = conn.execute(f"COPY ({query}) TO '{target}' (FORMAT JSON, ARRAY true)").fetchone() or (0,)
+    print(f"  ✓ {path.name}: {rows} rows")
+    return path
+
+
+def generate_analytics(
+    parquet_dir: Path | None = None,
+    output_dir: Path | None = None,
+    profile_dir: Path | None = None,
+) -> dict[str, Path]:
     """
     Generate analytics JSON files from Parquet data.
 
     Args:
         parquet_dir: Directory containing parquet files. If None, reads from R2.
         output_dir: Directory to write JSON files. Defaults to parquet_dir or current dir.
+        profile_dir: If set, write a DuckDB JSON query profile per analytics file here
+            (plus ``load_comments.json`` and ``comment_groups.json`` for the temp tables).
 
     Returns:
         Dict mapping analytics name to output file path.
@@ -33,6 +59,9 @@ def generate_analytics(parquet_dir: Path | None = None, output_dir: Path | None
     else:
         # Install httpfs for remote access
         conn.execute("INSTALL httpfs; LOAD httpfs;")
+        # dockets.parquet is read by both the statistics and cross-agency
+        # queries; cache its HEAD and footer so the second read skips them.
+        conn.execute("SET enable_http_metadata_cache=true; SET parquet_metadata_cache=true;")
         comments_src = f"'{R2_BASE_URL}/comments.parquet'"
         dockets_src = f"'{R2_BASE_URL}/dockets.parquet'"
         documents_src = f"'{R2_BASE_URL}/documents.parquet'"
@@ -41,76 +70,91 @@ def generate_analytics(parquet_dir: Path | None = None, output_dir: Path | None
     analytics_dir = output_dir / "analytics"
     analytics_dir.mkdir(parents=True, exist_ok=True)
 
+    if profile_dir:
+        # Kept out of analytics_dir, which is published as-is.
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        conn.execute("SET enable_profiling='json'")
+
     outputs = {}
 
+    # Scan comments once, keeping only the columns the queries below use, so
+    # the five comment aggregates share one read of the (usually remote)
+    # file. The body is only ever counted distinct, so a 128-bit hash of it
+    # stands in for the text, and posted_date is parsed here once rather than
+    # per query (malformed dates become NULL).
+    print("Loading comments...")
+    _profile_to(conn, profile_dir, "load_comments")
+    conn.execute(f"""
+    CREATE TEMP TABLE c AS
+    SELECT
+        docket_id,
+        agency_code,
+        title,
+        md5_number(comment) as comment_hash,
+        TRY_CAST(posted_date AS DATE) as posted_date
+    FROM read_parquet({comments_src}, hive_partitioning=false)
+    """)
+
+    # Most queries only count comments per agency/docket/title, so roll c up
+    # to that grain once; they then aggregate the (much smaller) group counts.
+    _profile_to(conn, profile_dir, "comment_groups")
+    conn.execute("""
+    CREATE TEMP TABLE comment_groups AS
+    SELECT agency_code, docket_id, title, COUNT(*) as n
+    FROM c
+    GROUP BY agency_code, docket_id, title
+    """)
+
     # 1. Statistics - dataset overview
     print("Generating statistics...")
     stats_query = f"""
-    WITH stats AS (
-        SELECT 
-            (SELECT COUNT(*) FROM read_parquet({dockets_src})) as total_dockets,
-            (SELECT COUNT(*) FROM read_parquet({documents_src})) as total_documents,
-            (SELECT COUNT(*) FROM read_parquet({comments_src})) as total_comments
+    WITH per_agency AS (
+        SELECT agency_code, SUM(n) as cnt
+        FROM comment_groups
+        GROUP BY agency_code
     ),
     top_agency AS (
-        SELECT agency_code, COUNT(*) as cnt
-        FROM read_parquet({comments_src})
-        GROUP BY agency_code
+        SELECT agency_code, cnt
+        FROM per_agency
         ORDER BY cnt DESC
         LIMIT 1
     )
     SELECT 
-        s.total_dockets,
-        s.total_documents,
-        s.total_comments,
+        (SELECT COUNT(*) FROM read_parquet({dockets_src}, hive_partitioning=false)) as total_dockets,
+        (SELECT COUNT(*) FROM read_parquet({documents_src}, hive_partitioning=false)) as total_documents,
+        (SELECT SUM(cnt) FROM per_agency)::BIGINT as total_comments,
         t.agency_code as top_agency,
-        t.cnt as top_agency_comments
-    FROM stats s, top_agency t
+        t.cnt::BIGINT as top_agency_comments
+    FROM top_agency t
     """
-    result = conn.execute(stats_query).fetchall()
-    columns = ["total_dockets", "total_documents", "total_comments", "top_agency", "top_agency_comments"]
-    stats_data = [dict(zip(columns, row)) for row in result]
-
-    stats_file = analytics_dir / "statistics.json"
-    with open(stats_file, "w") as f:
-        json.dump(stats_data, f)
-    outputs["statistics"] = stats_file
-    print(f"  ✓ statistics.json: {stats_data}")
+    outputs["statistics"] = _copy_json(conn, stats_query, analytics_dir / "statistics.json", profile_dir)
 
     # 2. Campaigns - dockets with high duplicate comment rates
     print("Generating campaigns...")
-    campaigns_query = f"""
+    campaigns_query = """
     SELECT 
         docket_id,
         agency_code,
         COUNT(*) as total_comments,
-        COUNT(DISTINCT comment) as unique_texts,
-        ROUND(100.0 * (COUNT(*) - COUNT(DISTINCT comment)) / COUNT(*), 1) as duplicate_percentage
-    FROM read_parquet({comments_src})
-    WHERE comment IS NOT NULL
+        COUNT(DISTINCT comment_hash) as unique_texts,
+        ROUND(100.0 * (COUNT(*) - COUNT(DISTINCT comment_hash)) / COUNT(*), 1) as duplicate_percentage
+    FROM c
+    WHERE comment_hash IS NOT NULL
     GROUP BY docket_id, agency_code
-    HAVING COUNT(*) > 1000 AND COUNT(*) > COUNT(DISTINCT comment)
+    HAVING COUNT(*) > 1000 AND COUNT(*) > COUNT(DISTINCT comment_hash)
     ORDER BY duplicate_percentage DESC
     LIMIT 10
     """
-    result = conn.execute(campaigns_query).fetchall()
-    columns = ["docket_id", "agency_code", "total_comments", "unique_texts", "duplicate_percentage"]
-    campaigns_data = [dict(zip(columns, row)) for row in result]
-
-    campaigns_file = analytics_dir / "campaigns.json"
-    with open(campaigns_file, "w") as f:
-        json.dump(campaigns_data, f)
-    outputs["campaigns"] = campaigns_file
-    print(f"  ✓ campaigns.json: {len(campaigns_data)} rows")
+    outputs["campaigns"] = _copy_json(conn, campaigns_query, analytics_dir / "campaigns.json", profile_dir)
 
     # 3. Organizations - most active commenters
     print("Generating organizations...")
-    orgs_query = f"""
+    orgs_query = """
     SELECT 
         title,
-        COUNT(*) as comment_count,
+        SUM(n)::BIGINT as comment_count,
         COUNT(DISTINCT docket_id) as docket_count
-    FROM read_parquet({comments_src})
+    FROM comment_groups
     WHERE title IS NOT NULL
         AND title NOT LIKE 'Comment%'
         AND title NOT LIKE 'Anonymous%'
@@ -120,61 +164,35 @@ def generate_analytics(parquet_dir: Path | None = None, output_dir: Path | None
     ORDER BY docket_count DESC
     LIMIT 15
     """
-    result = conn.execute(orgs_query).fetchall()
-    columns = ["title", "comment_count", "docket_count"]
-    orgs_data = [dict(zip(columns, row)) for row in result]
-
-    orgs_file = analytics_dir / "organizations.json"
-    with open(orgs_file, "w") as f:
-        json.dump(orgs_data, f)
-    outputs["organizations"] = orgs_file
-    print(f"  ✓ organizations.json: {len(orgs_data)} rows")
+    outputs["organizations"] = _copy_json(conn, orgs_query, analytics_dir / "organizations.json", profile_dir)
 
     # 4. Agency Activity - most active agencies by comment volume
     print("Generating agency activity...")
-    agency_query = f"""
+    agency_query = """
     SELECT 
         agency_code,
-        COUNT(*) as comment_count,
+        SUM(n)::BIGINT as comment_count,
         COUNT(DISTINCT docket_id) as docket_count
-    FROM read_parquet({comments_src})
+    FROM comment_groups
     GROUP BY agency_code
     ORDER BY comment_count DESC
     LIMIT 20
     """
-    result = conn.execute(agency_query).fetchall()
-    columns = ["agency_code", "comment_count", "docket_count"]
-    agency_data = [dict(zip(columns, row)) for row in result]
-
-    agency_file = analytics_dir / "agency_activity.json"
-    with open(agency_file, "w") as f:
-        json.dump(agency_data, f)
-    outputs["agency_activity"] = agency_file
-    print(f"  ✓ agency_activity.json: {len(agency_data)} rows")
+    outputs["agency_activity"] = _copy_json(conn, agency_query, analytics_dir / "agency_activity.json", profile_dir)
 
     # 5. Comment Trends - monthly comment volumes
     print("Generating comment trends...")
-    trends_query = f"""
+    trends_query = """
     SELECT 
-        EXTRACT(YEAR FROM TRY_CAST(posted_date AS DATE)) as year,
-        EXTRACT(MONTH FROM TRY_CAST(posted_date AS DATE)) as month,
+        EXTRACT(YEAR FROM posted_date) as year,
+        EXTRACT(MONTH FROM posted_date) as month,
         COUNT(*) as comment_count
-    FROM read_parquet({comments_src})
-    WHERE posted_date IS NOT NULL 
-      AND TRY_CAST(posted_date AS DATE) IS NOT NULL
-      AND TRY_CAST(posted_date AS DATE) >= '2010-01-01'
+    FROM c
+    WHERE posted_date >= DATE '2010-01-01'
     GROUP BY 1, 2
     ORDER BY 1, 2
     """
-    result = conn.execute(trends_query).fetchall()
-    columns = ["year", "month", "comment_count"]
-    trends_data = [dict(zip(columns, row)) for row in result]
-
-    trends_file = analytics_dir / "comment_trends.json"
-    with open(trends_file, "w") as f:
-        json.dump(trends_data, f)
-    outputs["comment_trends"] = trends_file
-    print(f"  ✓ comment_trends.json: {len(trends_data)} rows")
+    outputs["comment_trends"] = _copy_json(conn, trends_query, analytics_dir / "comment_trends.json", profile_dir)
 
     # 6. Cross-Agency - dockets with comments from multiple agencies
     print("Generating cross-agency analysis...")
@@ -183,34 +201,26 @@ def generate_analytics(parquet_dir: Path | None = None, output_dir: Path | None
         d.docket_id,
         d.title,
         d.agency_code as primary_agency,
-        COUNT(DISTINCT c.agency_code) as commenting_agencies,
-        COUNT(*) as total_comments
-    FROM read_parquet({dockets_src}) d
-    JOIN read_parquet({comments_src}) c ON d.docket_id = c.docket_id
+        COUNT(DISTINCT g.agency_code) as commenting_agencies,
+        SUM(g.n)::BIGINT as total_comments
+    FROM read_parquet({dockets_src}, hive_partitioning=false) d
+    JOIN comment_groups g ON d.docket_id = g.docket_id
     GROUP BY d.docket_id, d.title, d.agency_code
-    HAVING COUNT(DISTINCT c.agency_code) > 1
+    HAVING COUNT(DISTINCT g.agency_code) > 1
     ORDER BY commenting_agencies DESC, total_comments DESC
     LIMIT 15
     """
-    result = conn.execute(cross_query).fetchall()
-    columns = ["docket_id", "title", "primary_agency", "commenting_agencies", "total_comments"]
-    cross_data = [dict(zip(columns, row)) for row in result]
-
-    cross_file = analytics_dir / "cross_agency.json"
-    with open(cross_file, "w") as f:
-        json.dump(cross_data, f)
-    outputs["cross_agency"] = cross_file
-    print(f"  ✓ cross_agency.json: {len(cross_data)} rows")
+    outputs["cross_agency"] = _copy_json(conn, cross_query, analytics_dir / "cross_agency.json", profile_dir)
 
     # 7. Frequent Commenters - entities commenting across many agencies
     print("Generating frequent commenters...")
-    commenters_query = f"""
+    commenters_query = """
     SELECT 
         title as commenter,
-        COUNT(*) as total_comments,
+        SUM(n)::BIGINT as total_comments,
         COUNT(DISTINCT agency_code) as agencies_count,
         COUNT(DISTINCT docket_id) as dockets_count
-    FROM read_parquet({comments_src})
+    FROM comment_groups
     WHERE title IS NOT NULL
       AND title NOT LIKE 'Comment%'
       AND title NOT LIKE 'Anonymous%'
@@ -220,15 +230,9 @@ def generate_analytics(parquet_dir: Path | None = None, output_dir: Path | None
     ORDER BY agencies_count DESC, total_comments DESC
     LIMIT 20
     """
-    result = conn.execute(commenters_query).fetchall()
-    columns = ["commenter", "total_comments", "agencies_count", "dockets_count"]
-    commenters_data = [dict(zip(columns, row)) for row in result]
-
-    commenters_file = analytics_dir / "frequent_commenters.json"
-    with open(commenters_file, "w") as f:
-        json.dump(commenters_data, f)
-    outputs["frequent_commenters"] = commenters_file
-    print(f"  ✓ frequent_commenters.json: {len(commenters_data)} rows")
+    outputs["frequent_commenters"] = _copy_json(
+        conn, commenters_query, analytics_dir / "frequent_commenters.json", profile_dir
+    )
 
     conn.close()
     print(f"\nAnalytics generated in: {analytics_dir}")
@@ -241,6 +245,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate analytics JSON from Parquet")
     parser.add_argument("--parquet-dir", type=Path, help="Directory with parquet files (default: read from R2)")
     parser.add_argument("--output-dir", type=Path, help="Output directory for JSON files")
+    parser.add_argument("--profile-dir", type=Path, help="Write a DuckDB query profile per analytics file here")
     args = parser.parse_args()
 
-    generate_analytics(args.parquet_dir, args.output_dir)
+    generate_analytics(args.parquet_dir, args.output_dir, args.profile_dir)
@@ -16,8 +16,8 @@ file is skipped this run and picked up on the next one — never data loss.
 """
 
 from array import array
-from collections.abc import Container, Iterable
-from hashlib import md5, sha1
+from collections.abc import Container, Iterable, Iterator
+from hashlib import blake2b
 from math import log
 from pathlib import Path
 from threading import Lock
@@ -48,11 +48,14 @@ class BloomFilter:
         # 'L' = unsigned long (4 bytes each)
         self._bits = array("L", [0]) * (self._nbits // 32 + 1)
 
-    def _hashes(self, key: str) -> list[int]:
-        kb = key.encode()
-        h1 = int.from_bytes(md5(kb).digest()[:8], "little")
-        h2 = int.from_bytes(sha1(kb).digest()[:8], "little")
-        return [(h1 + i * h2) % self._nbits for i in range(self._k)]
+    def _hashes(self, key: str) -> Iterator[int]:
+        # Double hashing from the two halves of one 128-bit digest: a single
+        # blake2b call per key instead of md5 + sha1. Lazy, so a lookup stops
+        # at the first unset bit.
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little")
+        return ((h1 + i * h2) % self._nbits for i in range(self._k))
 
     def add(self, key: str) -> None:
         for pos in self._hashes(key):
@@ -94,9 +97,8 @@ def save_manifest(output_dir: Path, new_keys: set[str]) -> None:
         new_table = pa.table({"key": list(new_keys)}).cast(schema)
         writer.write_table(new_table)
 
-    if manifest_file.exists():
-        manifest_file.unlink()
-    temp_file.rename(manifest_file)
+    # replace() overwrites atomically: the manifest is never briefly missing.
+    temp_file.replace(manifest_file)
 
     total = existing_rows + len(new_keys)
     logger.info("Saved manifest: {:,} keys ({:,} existing + {:,} new)", total, existing_rows, len(new_keys))
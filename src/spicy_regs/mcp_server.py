@@ -249,14 +249,47 @@ def _attach_catalog(con: duckdb.DuckDBPyConnection, config: dict[str, str]) -> b
         return False
 
 
-def _connect() -> duckdb.DuckDBPyConnection:
-    con = duckdb.connect()
+def _set_home_directory(con: duckdb.DuckDBPyConnection) -> None:
     # Must precede INSTALL/LOAD: that step writes the extension under
     # <home_directory>/.duckdb, and the default home is read-only or undefined
     # on serverless hosts.
     con.execute(f"SET home_directory='{HOME_DIRECTORY.replace(chr(39), chr(39) * 2)}'")
+
+
+def _warm_extensions() -> None:
+    """Download the extensions :func:`_connect` needs before the first tool call.
+
+    ``INSTALL`` is a cheap existence check once the extension file is cached
+    under the home directory, but the first one fetches it over the network —
+    a multi-second stall that would otherwise land on the first user query.
+    Best-effort: a failure is logged and resurfaces on the first real connect.
+
+    Only the long-lived stdio server (:func:`main`) warms up; a serverless
+    cold start in :func:`build_app` would pay the download without any later
+    query to amortise it over.
+    """
+    con = duckdb.connect()
+    try:
+        _set_home_directory(con)
+        con.execute("INSTALL httpfs")
+        if _resolve_catalog_config() is not None:
+            con.execute("INSTALL iceberg")
+    except duckdb.Error as exc:
+        logger.warning("DuckDB extension warm-up failed: %s", exc)
+    finally:
+        con.close()
+
+
+def _connect() -> duckdb.DuckDBPyConnection:
+    con = duckdb.connect()
+    _set_home_directory(con)
     con.execute("INSTALL httpfs")
     con.execute("LOAD httpfs")
+    # Creating the views binds them, which already fetches each file's HEAD
+    # and parquet footer; cache both so the tool's own query reuses them
+    # instead of repeating those round trips to R2.
+    con.execute("SET enable_http_metadata_cache=true")
+    con.execute("SET parquet_metadata_cache=true")
 
     # Optionally attach the Iceberg catalog (before the config lock) so the
     # comments view can be served from it.
@@ -417,7 +450,11 @@ def build_app():
 
 def main() -> None:
     """Stdio entry point used by the ``spicy-regs-mcp`` console script."""
-    build_server().run()
+    server = build_server()
+    # Warm up in the background so the stdio handshake is not held up by the
+    # download; a first tool call that races it just installs on its own.
+    threading.Thread(target=_warm_extensions, name="warm-extensions", daemon=True).start()
+    server.run()
 
 
 if __name__ == "__main__":
@@ -13,8 +13,23 @@ import polars as pl
 from spicy_regs.schemas.base import RecordType
 
 
+def _extract_docket(d: dict) -> dict:
+    data = d.get("data", {})
+    attrs = data.get("attributes", {})
+    return {
+        "docket_id": (v.strip('"') if (v := data.get("id")) else v),
+        "agency_code": attrs.get("agencyId"),
+        "title": attrs.get("title"),
+        "docket_type": attrs.get("docketType"),
+        "modify_date": attrs.get("modifyDate"),
+        "abstract": attrs.get("dkAbstract"),
+        "rin": attrs.get("rin"),
+    }
+
+
 def _extract_comment(d: dict) -> dict:
-    attrs = d.get("data", {}).get("attributes", {})
+    data = d.get("data", {})
+    attrs = data.get("attributes", {})
 
     # Build compact attachments JSON from the included array
     attachments = []
@@ -30,7 +45,7 @@ def _extract_comment(d: dict) -> dict:
                 attachments.append({"title": inc_attrs.get("title", ""), "formats": formats})
 
     return {
-        "comment_id": d.get("data", {}).get("id"),
+        "comment_id": data.get("id"),
         "docket_id": (v.strip('"') if (v := attrs.get("docketId")) else v),
         "agency_code": attrs.get("agencyId"),
         "first_name": attrs.get("firstName"),
@@ -54,7 +69,8 @@ def _extract_comment(d: dict) -> dict:
 
 
 def _extract_document(d: dict) -> dict:
-    attrs = d.get("data", {}).get("attributes", {})
+    data = d.get("data", {})
+    attrs = data.get("attributes", {})
 
     # Each fileFormats entry is one downloadable rendition of the document
     # (e.g. content.pdf), carrying its own URL, format, and byte size. Keep the
@@ -66,7 +82,7 @@ def _extract_document(d: dict) -> dict:
     ]
 
     return {
-        "document_id": d.get("data", {}).get("id"),
+        "document_id": data.get("id"),
         "docket_id": (v.strip('"') if (v := attrs.get("docketId")) else v),
         "agency_code": attrs.get("agencyId"),
         "title": attrs.get("title"),
@@ -101,15 +117,7 @@ DOCKET = RecordType(
         "rin": pl.Utf8,
     },
     dedup_key="docket_id",
-    extract=lambda d: {
-        "docket_id": (v.strip('"') if (v := d.get("data", {}).get("id")) else v),
-        "agency_code": d.get("data", {}).get("attributes", {}).get("agencyId"),
-        "title": d.get("data", {}).get("attributes", {}).get("title"),
-        "docket_type": d.get("data", {}).get("attributes", {}).get("docketType"),
-        "modify_date": d.get("data", {}).get("attributes", {}).get("modifyDate"),
-        "abstract": d.get("data", {}).get("attributes", {}).get("dkAbstract"),
-        "rin": d.get("data", {}).get("attributes", {}).get("rin"),
-    },
+    extract=_extract_docket,
 )
 
 
@@ -3,7 +3,7 @@ from spicy_regs.sources.base import Reader, Writer
 from spicy_regs.sources.derived_text import DerivedCommentText
 from spicy_regs.sources.mirrulations import MirrulationsReader
 from spicy_regs.sources.parquet import StagingWriter
-from spicy_regs.sources.pdf import fetch_pdf_bytes
+from spicy_regs.sources.pdf import fetch_pdf_bytes, pdf_client
 
 __all__ = [
     "Reader",
@@ -12,6 +12,7 @@ __all__ = [
     "DerivedCommentText",
     "StagingWriter",
     "fetch_pdf_bytes",
+    "pdf_client",
     "r2",
     "iceberg",
 ]
@@ -37,6 +37,8 @@ Credentials are read from the environment, alongside the existing ``R2_*`` vars:
 from os import getenv
 from pathlib import Path
 
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from loguru import logger
 
 from spicy_regs.schemas import RecordType
@@ -70,9 +72,28 @@ def _sql_str(value: str) -> str:
     return value.replace("'", "''")
 
 
-def _connect():
+def _apply_resource_settings(con, spill_dir: Path) -> None:
+    """Bound the connection's memory the way the staging transforms do.
+
+    The merge and the snapshot export scan whole tables; without a cap DuckDB
+    sizes itself to the runner's RAM, and keeping insertion order forces it to
+    buffer rows it could otherwise stream. Neither step depends on scan order —
+    the export sorts explicitly. What doesn't fit spills to ``spill_dir``
+    (``{output_dir}/.duckdb_tmp``, as in the transforms) rather than a
+    ``.tmp`` under whatever the working directory happens to be.
+    """
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    con.execute("SET memory_limit='4GB'")
+    con.execute("SET preserve_insertion_order=false")
+    con.execute(f"SET temp_directory='{_sql_str(str(spill_dir))}'")
+
+
+def _connect(spill_dir: Path):
     """Open a DuckDB connection with the R2 Data Catalog attached.
 
+    ``spill_dir`` is where DuckDB spills when a merge or export outgrows the
+    memory limit (see :func:`_apply_resource_settings`).
+
     ``CREATE SECRET`` / ``ATTACH`` do not accept bind parameters, so the
     credentials are inlined with single-quote escaping. The token never leaves
     this process — it is read from the environment, used to attach, and the
@@ -89,6 +110,7 @@ def _connect():
     token = getenv("R2_CATALOG_TOKEN", "")
 
     con = duckdb.connect()
+    _apply_resource_settings(con, spill_dir)
     con.execute("INSTALL iceberg; LOAD iceberg;")
     con.execute("INSTALL httpfs; LOAD httpfs;")
     con.execute(f"CREATE OR REPLACE SECRET r2_catalog_secret (TYPE ICEBERG, TOKEN '{_sql_str(token)}');")
@@ -309,7 +331,7 @@ def merge_comments(staging_dir: Path, output_dir: Path, record_type: RecordType)
         logger.info("iceberg: no staging files for {}; skipping merge", record_type.name)
         return None
 
-    con = _connect()
+    con = _connect(output_dir / ".duckdb_tmp")
     try:
         _ensure_table(con, record_type)
         logger.info(
@@ -318,9 +340,12 @@ def merge_comments(staging_dir: Path, output_dir: Path, record_type: RecordType)
             _qualified(record_type),
         )
         _merge(con, staging_files, record_type)
-        total = con.execute(f"SELECT count(*) FROM {_qualified(record_type)}").fetchone()[0]
-        logger.info("iceberg: {} now holds {:,} rows", record_type.name, total)
         index_file = _build_comments_index(con, record_type, output_dir)
+        # The index was just counted from the whole table, so its row_count
+        # column already sums to the table size (less rows the index skips for
+        # a NULL posted_date/agency/docket) — no second scan just to log it.
+        total = pc.sum(pq.read_table(index_file, columns=["row_count"])["row_count"]).as_py() or 0
+        logger.info("iceberg: {} now holds {:,} indexed rows", record_type.name, total)
         logger.info("iceberg: rebuilt comments index at {}", index_file)
         return index_file
     finally:
@@ -339,7 +364,7 @@ def merge_and_export(staging_dir: Path, output_dir: Path, record_type: RecordTyp
         logger.info("iceberg: no staging files for {}; skipping merge", record_type.name)
         return None
 
-    con = _connect()
+    con = _connect(output_dir / ".duckdb_tmp")
     try:
         _ensure_table(con, record_type)
         logger.info(
@@ -348,9 +373,11 @@ def merge_and_export(staging_dir: Path, output_dir: Path, record_type: RecordTyp
             _qualified(record_type),
         )
         _merge(con, staging_files, record_type)
-        total = con.execute(f"SELECT count(*) FROM {_qualified(record_type)}").fetchone()[0]
-        logger.info("iceberg: {} now holds {:,} rows", record_type.name, total)
         out_file = _export_parquet(con, record_type, output_dir)
+        # The export wrote every row of the table, so its footer already holds
+        # the count — no second full scan of the remote table just to log it.
+        total = pq.ParquetFile(out_file).metadata.num_rows
+        logger.info("iceberg: {} now holds {:,} rows", record_type.name, total)
         logger.info("iceberg: exported public snapshot to {}", out_file)
         return out_file
     finally:
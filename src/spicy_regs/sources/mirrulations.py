@@ -13,7 +13,8 @@ into schema-shaped records is the job of the
 
 import re
 from collections.abc import Callable, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from json import loads
 from threading import Lock
 from typing import Any
@@ -36,6 +37,10 @@ PREFIX = "raw-data"
 # anonymous resource is shared across the pool: unsigned read-only GetObject has
 # no credential-refresh race, and botocore's connection pool is thread-safe.
 DEFAULT_DOWNLOAD_WORKERS = 16
+# Downloads queued per worker thread: enough that a thread never idles waiting
+# for the next key, without a future per key for the whole agency.
+_IN_FLIGHT_PER_WORKER = 4
+_RETRIES = {"mode": "adaptive", "max_attempts": 5}
 
 
 def s3_resource(max_pool_connections: int = DEFAULT_DOWNLOAD_WORKERS) -> Any:
@@ -45,17 +50,26 @@ def s3_resource(max_pool_connections: int = DEFAULT_DOWNLOAD_WORKERS) -> Any:
     to 10, but the reader fans GETs across ``DEFAULT_DOWNLOAD_WORKERS`` threads.
     A pool smaller than the thread count oversubscribes — connections churn into
     CLOSE_WAIT and the run stalls — so the pool must be at least the worker count.
+
+    Pooled connections sit idle between agencies, so TCP keepalive is on; and
+    retries are adaptive so a burst of S3 throttling backs the pool off instead
+    of each thread retrying on its own schedule.
     """
     return boto3.resource(
         "s3",
         region_name="us-east-1",
-        config=BotoConfig(signature_version=UNSIGNED, max_pool_connections=max_pool_connections),
+        config=BotoConfig(
+            signature_version=UNSIGNED,
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            retries=_RETRIES,
+        ),
     )
 
 
 def s3_client() -> Any:
     """Anonymous S3 client (used only for agency discovery)."""
-    return boto3.client("s3", region_name="us-east-1", config=BotoConfig(signature_version=UNSIGNED))
+    return boto3.client("s3", region_name="us-east-1", config=BotoConfig(signature_version=UNSIGNED, retries=_RETRIES))
 
 
 def get_agencies(s3_client: Any, bucket_name: str, prefix: str) -> list[str]:
@@ -77,6 +91,19 @@ def get_agencies(s3_client: Any, bucket_name: str, prefix: str) -> list[str]:
     return sorted(agencies)
 
 
+def _iter_keys(s3_resource: Any, bucket_name: str, prefix: str) -> Iterator[str]:
+    """Yield every key under ``prefix``, read straight off ``list_objects_v2`` pages.
+
+    ``Bucket.objects.filter`` pages through the same API but wraps each entry
+    in an ``ObjectSummary`` resource; agency prefixes hold hundreds of
+    thousands of keys, so the plain page dicts are much cheaper to walk.
+    """
+    paginator = s3_resource.meta.client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for obj in page.get("Contents", ()):
+            yield obj["Key"]
+
+
 def list_json_files(
     s3_resource: Any,
     bucket_name: str,
@@ -96,10 +123,7 @@ def list_json_files(
     skipped = 0
     filtered_by_year = 0
     total_scanned = 0
-    bucket = s3_resource.Bucket(bucket_name)
-
-    for obj in bucket.objects.filter(Prefix=f"{prefix}/{agency}/"):
-        key = obj.key
+    for key in _iter_keys(s3_resource, bucket_name, f"{prefix}/{agency}/"):
         if "/text-" in key and path_pattern in key and key.endswith(".json"):
             total_scanned += 1
             if since_year:
@@ -144,9 +168,7 @@ def list_agency_files_by_type(
     patterns = [(rt.name, rt.path_pattern) for rt in record_types if rt.path_pattern]
     result: dict[str, list[str]] = {rt.name: [] for rt in record_types}
 
-    bucket = s3_resource.Bucket(bucket_name)
-    for obj in bucket.objects.filter(Prefix=f"{prefix}/{agency}/"):
-        key = obj.key
+    for key in _iter_keys(s3_resource, bucket_name, f"{prefix}/{agency}/"):
         if "/text-" not in key or not key.endswith(".json"):
             continue
         matched = next((name for name, pattern in patterns if pattern in key), None)
@@ -173,10 +195,13 @@ def download_and_parse(
     key: str,
     extract_fn: Callable[[dict], dict],
 ) -> dict | None:
-    """Download a single JSON file from S3 and parse it with the given extractor."""
+    """Download a single JSON file from S3 and parse it with the given extractor.
+
+    Goes through the resource's underlying client: building an ``Object``
+    resource per key costs more than the tiny GET it wraps.
+    """
     try:
-        obj = s3_resource.Object(bucket_name, key)
-        content = obj.get()["Body"].read()
+        content = s3_resource.meta.client.get_object(Bucket=bucket_name, Key=key)["Body"].read()
         data = loads(content)
         return extract_fn(data)
     except Exception:
@@ -258,15 +283,28 @@ class MirrulationsReader(Reader):
                     yield payload
             return
 
+        # Keep a bounded window of GETs in flight instead of submitting every
+        # key up front, which allocated a future per key (hundreds of
+        # thousands for a large agency) and let finished payloads pile up
+        # faster than the consumer drained them.
+        keys = iter(self.last_keys)
+
+        def submit(key: str) -> Future:
+            return executor.submit(download_and_parse, self.s3_resource, self.bucket, key, _identity)
+
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = [
-                executor.submit(download_and_parse, self.s3_resource, self.bucket, key, _identity)
-                for key in self.last_keys
-            ]
-            for future in as_completed(futures):
-                payload = future.result()
-                if payload is not None:
-                    yield payload
+            pending = {submit(key) for key in islice(keys, workers * _IN_FLIGHT_PER_WORKER)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Refill before yielding so the pool stays busy while the
+                    # consumer handles this payload.
+                    next_key = next(keys, None)
+                    if next_key is not None:
+                        pending.add(submit(next_key))
+                    payload = future.result()
+                    if payload is not None:
+                        yield payload
 
 
 class _AgencyListingCache:
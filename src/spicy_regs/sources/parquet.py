@@ -29,12 +29,18 @@ class StagingWriter(Writer):
         self.rows_written = 0
 
     def write(self, records: Iterable[dict]) -> None:
-        # write_staging expects a concrete list (it checks emptiness and length).
-        materialized = list(records)
+        # Accumulate column lists rather than keeping every record dict alive
+        # until the write; polars builds each column straight from its list.
+        fields = list(self.record_type.schema)
+        columns: dict[str, list] = {field: [] for field in fields}
+        appenders = [(field, columns[field].append) for field in fields]
+        for record in records:
+            for field, append in appenders:
+                append(record.get(field))
         self.rows_written = write_staging(
             self.agency,
             self.record_type.name,
-            materialized,
+            columns,
             self.staging_dir,
             self.record_type.schema,
         )
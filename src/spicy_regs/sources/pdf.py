@@ -15,6 +15,25 @@ from loguru import logger
 # guard against a pathological multi-hundred-MB file blowing up a batch run.
 DEFAULT_MAX_BYTES = 100 * 1024 * 1024
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_CONNECT_TIMEOUT = 5.0
+# Transport-level retries cover connection failures (resets, refused), not
+# HTTP error statuses — those still come back as ``None`` from the fetch.
+DEFAULT_CONNECT_RETRIES = 2
+
+
+def pdf_client(*, max_connections: int = 8, timeout: float = DEFAULT_TIMEOUT) -> httpx.Client:
+    """An ``httpx.Client`` for sharing across many :func:`fetch_pdf_bytes` calls.
+
+    Keeps up to ``max_connections`` keep-alive connections open (size it to the
+    number of fetching threads, so no worker waits on the pool) and retries
+    failed connects before giving up on a URL.
+    """
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return httpx.Client(
+        timeout=httpx.Timeout(timeout, connect=DEFAULT_CONNECT_TIMEOUT),
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(limits=limits, retries=DEFAULT_CONNECT_RETRIES),
+    )
 
 
 def fetch_pdf_bytes(
@@ -14,17 +14,46 @@ where a transient download error produced an empty local file that overwrote the
 3.3 GB historical ``comments.parquet`` on R2.
 """
 
+import hashlib
+import time
 from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from os import getenv
 from pathlib import Path
+from threading import Lock
 
 import boto3
 import httpx
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from dotenv import load_dotenv
 from loguru import logger
 
 load_dotenv()
 
+# Public-URL downloads stream multi-GB parquet: read in 1 MiB chunks (httpx's
+# default is a few KB per iteration), and allow a slow R2 edge up to a minute
+# between reads before giving up (httpx's default is 5s).
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Uploads: files above 8 MiB go up as parallel 8 MiB parts, and directory
+# publishes (comment partitions) push up to UPLOAD_WORKERS files at once —
+# both are bound by round-trips to R2, not by local CPU.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+UPLOAD_WORKERS = 8
+
+# botocore already retries individual requests; these cover a whole transfer
+# failing (e.g. a multipart upload losing a part after those retries), waiting
+# UPLOAD_BACKOFF_SECONDS * 2**n between attempts.
+UPLOAD_ATTEMPTS = 3
+UPLOAD_BACKOFF_SECONDS = 2.0
+
 
 # --- download (public URL) -------------------------------------------------
 
@@ -57,7 +86,7 @@ def download_from_r2(remote_key: str, local_path: Path) -> bool:
     temp_path = local_path.with_suffix(local_path.suffix + ".tmp")
 
     try:
-        with httpx.stream("GET", url, follow_redirects=True) as response:
+        with httpx.stream("GET", url, follow_redirects=True, timeout=DOWNLOAD_TIMEOUT) as response:
             if response.status_code == 404:
                 logger.info("{} not found on R2 (404)", remote_key)
                 return False
@@ -67,7 +96,7 @@ def download_from_r2(remote_key: str, local_path: Path) -> bool:
                     f"{response.status_code}"
                 )
             with open(temp_path, "wb") as f:
-                for chunk in response.iter_bytes():
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
     except BaseException:
         if temp_path.exists():
@@ -87,19 +116,42 @@ def download(remote_key: str, local_path: Path) -> bool:
 # --- upload (S3 API) -------------------------------------------------------
 
 
+_R2_CLIENT_LOCK = Lock()
+
+
 def get_r2_client():
-    """Create a boto3 client configured for R2."""
+    """The process-wide boto3 client for R2, created on first use.
+
+    boto3 clients are thread-safe, so every upload shares this one client
+    and its connection pool instead of building a session per file. The
+    pool covers ``UPLOAD_WORKERS`` files each sending
+    ``TRANSFER_CONFIG.max_concurrency`` parts at once.
+
+    *Creating* a client from boto3's default session is not thread-safe,
+    and the first call can come from several upload workers at once, so
+    construction is serialised behind a lock.
+    """
+    with _R2_CLIENT_LOCK:
+        return _r2_client()
+
+
+@cache
+def _r2_client():
     return boto3.client(
         "s3",
         endpoint_url=getenv("R2_ENDPOINT"),
         aws_access_key_id=getenv("R2_ACCESS_KEY_ID"),
         aws_secret_access_key=getenv("R2_SECRET_ACCESS_KEY"),
         region_name="auto",
+        config=BotoConfig(
+            max_pool_connections=UPLOAD_WORKERS * TRANSFER_CONFIG.max_concurrency,
+            retries={"mode": "adaptive", "max_attempts": 3},
+        ),
     )
 
 
-def _get_remote_size(client, bucket: str, remote_key: str) -> int | None:
-    """Return the existing R2 object size in bytes, or None if absent.
+def _head_object(client, bucket: str, remote_key: str) -> dict | None:
+    """Return the existing R2 object's HEAD response, or None if absent.
 
     Any other error (permissions, transient 5xx) propagates — callers
     must not guess at whether the remote object exists, since the
@@ -109,13 +161,44 @@ def _get_remote_size(client, bucket: str, remote_key: str) -> int | None:
     from botocore.exceptions import ClientError
 
     try:
-        resp = client.head_object(Bucket=bucket, Key=remote_key)
+        return client.head_object(Bucket=bucket, Key=remote_key)
     except ClientError as e:
         code = e.response.get("Error", {}).get("Code", "")
         if code in ("404", "NoSuchKey", "NotFound"):
             return None
         raise
-    return int(resp["ContentLength"])
+
+
+def _get_remote_size(client, bucket: str, remote_key: str) -> int | None:
+    """Return the existing R2 object size in bytes, or None if absent."""
+    head = _head_object(client, bucket, remote_key)
+    return None if head is None else int(head["ContentLength"])
+
+
+def _file_digests(path: Path) -> tuple[str, str]:
+    """``(md5, sha256)`` hex digests of ``path``, computed in one read."""
+    md5, sha256 = hashlib.md5(), hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            md5.update(chunk)
+            sha256.update(chunk)
+    return md5.hexdigest(), sha256.hexdigest()
+
+
+def _is_unchanged(head: dict | None, local_size: int, md5: str, sha256: str) -> bool:
+    """True when the remote object already holds exactly the local bytes.
+
+    Prefers the ``sha256`` metadata written by :func:`upload_file`; falls
+    back to the ETag, which is the body's MD5 only for single-part uploads
+    (multipart ETags carry a ``-<parts>`` suffix and can't be compared).
+    """
+    if head is None or int(head.get("ContentLength", -1)) != local_size:
+        return False
+    remote_sha256 = head.get("Metadata", {}).get("sha256")
+    if remote_sha256:
+        return remote_sha256 == sha256
+    etag = head.get("ETag", "").strip('"')
+    return bool(etag) and "-" not in etag and etag == md5
 
 
 def _assert_upload_safe(
@@ -155,7 +238,34 @@ def _assert_upload_safe(
         )
 
 
-def upload_file(local_path: Path, remote_key: str | None = None) -> None:
+def _transfer(client, local_path: Path, bucket: str, remote_key: str, extra_args: dict) -> None:
+    """``client.upload_file`` with up to ``UPLOAD_ATTEMPTS`` tries and exponential backoff."""
+    from boto3.exceptions import S3UploadFailedError
+    from botocore.exceptions import BotoCoreError
+
+    for attempt in range(1, UPLOAD_ATTEMPTS + 1):
+        try:
+            client.upload_file(
+                str(local_path),
+                bucket,
+                remote_key,
+                ExtraArgs=extra_args,
+                Config=TRANSFER_CONFIG,
+            )
+            return
+        except (S3UploadFailedError, BotoCoreError) as e:
+            if attempt == UPLOAD_ATTEMPTS:
+                logger.error("Upload of {} failed after {} attempts: {}", remote_key, attempt, e)
+                raise
+            delay = UPLOAD_BACKOFF_SECONDS * 2 ** (attempt - 1)
+            logger.warning(
+                "Upload of {} failed (attempt {}/{}), retrying in {:.0f}s: {}",
+                remote_key, attempt, UPLOAD_ATTEMPTS, delay, e,
+            )
+            time.sleep(delay)
+
+
+def upload_file(local_path: Path, remote_key: str | None = None, *, skip_unchanged: bool = True) -> None:
     """Publish a single file to R2 (remote key defaults to the filename).
 
     Before overwriting an existing remote object, checks the current
@@ -163,6 +273,12 @@ def upload_file(local_path: Path, remote_key: str | None = None) -> None:
     :func:`_assert_upload_safe`). This guards against the failure mode
     where an upstream error produces a near-empty local file that
     would otherwise silently wipe production data.
+
+    By default (``skip_unchanged``) the file is hashed and the upload is
+    skipped when the remote object already has the same content (see
+    :func:`_is_unchanged`); the SHA-256 is stored as object metadata so
+    the next run can compare against it. Pass ``skip_unchanged=False`` to
+    force a re-upload.
     """
     bucket = getenv("R2_BUCKET_NAME", "spicy-regs")
 
@@ -179,22 +295,30 @@ def upload_file(local_path: Path, remote_key: str | None = None) -> None:
     file_size = local_size_bytes / (1024 * 1024)
     logger.info("Uploading {} ({:.1f} MB) to R2...", local_path.name, file_size)
 
-    remote_size = _get_remote_size(client, bucket, remote_key)
+    head = _head_object(client, bucket, remote_key)
+    extra_args: dict = {"ContentType": "application/octet-stream"}
+    if skip_unchanged:
+        md5, sha256 = _file_digests(local_path)
+        if _is_unchanged(head, local_size_bytes, md5, sha256):
+            logger.info("Unchanged on R2, skipping: {}", remote_key)
+            return
+        extra_args["Metadata"] = {"sha256": sha256}
+
+    remote_size = None if head is None else int(head["ContentLength"])
     _assert_upload_safe(local_size_bytes, remote_size, remote_key)
 
-    client.upload_file(
-        str(local_path),
-        bucket,
-        remote_key,
-        ExtraArgs={"ContentType": "application/octet-stream"},
-    )
+    _transfer(client, local_path, bucket, remote_key, extra_args)
 
     public_url = getenv("R2_PUBLIC_URL", "")
     logger.info("Uploaded: {}/{}", public_url, remote_key)
 
 
 def upload_directory_to_r2(local_dir: Path, remote_prefix: str | None = None) -> None:
-    """Recursively upload a directory of Parquet to R2, preserving relative paths."""
+    """Recursively upload a directory of Parquet to R2, preserving relative paths.
+
+    Files whose content already matches the remote object are skipped, so
+    re-publishing a mostly unchanged tree costs a HEAD per file, not an upload.
+    """
     if not local_dir.is_dir():
         logger.warning("Skipping (not a directory): {}", local_dir)
         return
@@ -205,12 +329,26 @@ def upload_directory_to_r2(local_dir: Path, remote_prefix: str | None = None) ->
     files = sorted(local_dir.rglob("*.parquet"))
     logger.info("Uploading {} files from {}/ to R2...", len(files), local_dir.name)
 
-    for file_path in files:
-        relative = file_path.relative_to(local_dir)
-        remote_key = f"{remote_prefix}/{relative}"
-        upload_file(file_path, remote_key=remote_key)
+    _upload_all([(file_path, f"{remote_prefix}/{file_path.relative_to(local_dir)}") for file_path in files])
+
+    logger.info("Published {} files under {}/", len(files), remote_prefix)
 
-    logger.info("Uploaded {} files under {}/", len(files), remote_prefix)
+
+def _upload_all(uploads: list[tuple[Path, str]]) -> None:
+    """Run :func:`upload_file` for each ``(local_path, remote_key)`` concurrently.
+
+    Every upload is waited on; the first failure (e.g. the shrink guard)
+    is re-raised once the rest have finished.
+    """
+    if not uploads:
+        return
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_WORKERS, len(uploads))) as executor:
+        futures = [
+            executor.submit(upload_file, local_path, remote_key=remote_key)
+            for local_path, remote_key in uploads
+        ]
+    for future in futures:
+        future.result()
 
 
 def upload_dataset(output_dir: Path, data_types: list[str]) -> None:
@@ -233,36 +371,37 @@ def upload_dataset(output_dir: Path, data_types: list[str]) -> None:
     if manifest_file.exists():
         files_to_upload.append(manifest_file)
 
-    with ThreadPoolExecutor(max_workers=len(files_to_upload)) as executor:
-        executor.map(upload_file, files_to_upload)
+    _upload_all([(path, path.name) for path in files_to_upload])
 
 
 def upload_comment_partitions(output_dir: Path, changed_files: list[Path]) -> None:
     """Publish changed comment partition files and the comments index to R2."""
-    for local_path in changed_files:
-        remote_key = str(local_path.relative_to(output_dir))
-        upload_file(local_path, remote_key=remote_key)
+    uploads = [(local_path, str(local_path.relative_to(output_dir))) for local_path in changed_files]
 
     index_file = output_dir / "comments_index.parquet"
     if index_file.exists():
-        upload_file(index_file, remote_key="comments_index.parquet")
+        uploads.append((index_file, "comments_index.parquet"))
+
+    _upload_all(uploads)
 
     logger.info("Uploaded {} comment partitions + index", len(changed_files))
 
 
 def list_r2_files() -> list:
-    """List files in the R2 bucket."""
+    """List every object in the R2 bucket (paginated past the 1,000-key page limit)."""
     bucket = getenv("R2_BUCKET_NAME", "spicy-regs")
     client = get_r2_client()
 
-    response = client.list_objects_v2(Bucket=bucket)
-    if "Contents" not in response:
+    objects = []
+    for page in client.get_paginator("list_objects_v2").paginate(Bucket=bucket):
+        objects.extend(page.get("Contents", []))
+    if not objects:
         logger.info("Bucket is empty")
         return []
 
-    for obj in response["Contents"]:
+    for obj in objects:
         logger.info("{} ({:.1f} MB)", obj["Key"], obj["Size"] / 1024 / 1024)
-    return response["Contents"]
+    return objects
 
 
 if __name__ == "__main__":
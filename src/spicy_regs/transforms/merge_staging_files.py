@@ -1,10 +1,17 @@
 """Transform: merge per-agency staging Parquet into the deduplicated dataset."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import pyarrow.parquet as pq
 from loguru import logger
 
+# Total DuckDB memory budget for one merge_staging_files call, shared by the
+# data types merged concurrently. Each gets MERGE_MIN_MEMORY_MB, and the rest
+# is split in proportion to the bytes it reads (staging files + previous output).
+MERGE_MEMORY_LIMIT_MB = 4096
+MERGE_MIN_MEMORY_MB = 256
+
 
 def merge_staging_files(
     staging_dir: Path,
@@ -26,92 +33,149 @@ def merge_staging_files(
     dedup_keys: mapping of data_type name -> primary-key column name
                 (e.g. ``"dockets": "docket_id"``).  Dedup is by
                 (primary key) keeping ``MAX(modify_date)``.
+
+    Data types write distinct files, so they are merged concurrently (DuckDB
+    releases the GIL), sharing ``MERGE_MEMORY_LIMIT_MB`` by input size (see
+    :func:`_memory_budgets`), so a wide documents merge isn't starved to run
+    beside a small dockets merge.
     """
-    import duckdb
+    pending = [dt for dt in data_types_to_merge if any((staging_dir / dt).glob("*.parquet"))]
+    if not pending:
+        return
+
+    budgets = _memory_budgets({dt: _input_bytes(staging_dir, output_dir, dt) for dt in pending})
+    # At most MERGE_MEMORY_LIMIT_MB // MERGE_MIN_MEMORY_MB merges run at once,
+    # so even at the floor budget the concurrent total stays within the limit.
+    max_workers = min(len(pending), MERGE_MEMORY_LIMIT_MB // MERGE_MIN_MEMORY_MB)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _merge_one,
+                data_type,
+                staging_dir,
+                output_dir,
+                schemas[data_type],
+                dedup_keys.get(data_type),
+                budgets[data_type],
+            )
+            for data_type in pending
+        ]
+        for future in as_completed(futures):
+            future.result()
 
-    for data_type in data_types_to_merge:
-        staging_type_dir = staging_dir / data_type
-        output_file = output_dir / f"{data_type}.parquet"
 
-        if not staging_type_dir.exists():
-            continue
+def _input_bytes(staging_dir: Path, output_dir: Path, data_type: str) -> int:
+    """Bytes a data_type's merge reads: its staging files plus any previous output."""
+    inputs = list((staging_dir / data_type).glob("*.parquet"))
+    inputs.append(output_dir / f"{data_type}.parquet")
+    return sum(p.stat().st_size for p in inputs if p.exists())
 
-        staging_files = list(staging_type_dir.glob("*.parquet"))
-        if not staging_files:
-            continue
 
-        logger.info("Merging {} staging files for {}...", len(staging_files), data_type)
-
-        files_to_merge: list[Path] = []
-        if output_file.exists():
-            files_to_merge.append(output_file)
-        files_to_merge.extend(staging_files)
-
-        # Drop corrupt files so DuckDB doesn't abort the whole merge.
-        valid_files: list[Path] = []
-        for file_path in files_to_merge:
-            try:
-                pq.ParquetFile(file_path)
-            except Exception as e:
-                logger.warning(
-                    "{}: skipping corrupt file {}: {}",
-                    data_type, file_path.name, e,
-                )
-                continue
-            valid_files.append(file_path)
-
-        if not valid_files:
-            continue
+def _memory_budgets(input_bytes: dict[str, int]) -> dict[str, int]:
+    """Split ``MERGE_MEMORY_LIMIT_MB`` across data types by input size (in MB).
 
-        target_columns = list(schemas[data_type].keys())
-        key_col = dedup_keys.get(data_type)
-        if key_col is None:
-            raise ValueError(
-                f"merge_staging_files: no dedup key configured for '{data_type}'"
-            )
-        if key_col not in target_columns or "modify_date" not in target_columns:
-            raise ValueError(
-                f"merge_staging_files: schema for '{data_type}' must include "
-                f"'{key_col}' and 'modify_date'"
-            )
+    Every type gets at least ``MERGE_MIN_MEMORY_MB``; the remainder (if any —
+    with many types the floors can use it all) is shared in proportion to
+    ``input_bytes``. A lone merge gets the whole budget.
+    """
+    total = sum(input_bytes.values())
+    if not total:
+        return {dt: max(MERGE_MIN_MEMORY_MB, MERGE_MEMORY_LIMIT_MB // len(input_bytes)) for dt in input_bytes}
+    spare = max(0, MERGE_MEMORY_LIMIT_MB - MERGE_MIN_MEMORY_MB * len(input_bytes))
+    return {dt: MERGE_MIN_MEMORY_MB + spare * size // total for dt, size in input_bytes.items()}
 
-        temp_output = output_dir / f"{data_type}_merged.parquet"
 
-        # Escape single quotes in paths for inline SQL.
-        files_sql = ", ".join(f"'{str(p).replace(chr(39), chr(39) * 2)}'" for p in valid_files)
-        col_select = ", ".join(f'CAST("{c}" AS VARCHAR) AS "{c}"' for c in target_columns)
+def _merge_one(
+    data_type: str,
+    staging_dir: Path,
+    output_dir: Path,
+    schema: dict,
+    key_col: str | None,
+    memory_limit_mb: int,
+) -> None:
+    """Merge one data_type's staging files into ``{output_dir}/{data_type}.parquet``."""
+    import duckdb
+
+    staging_type_dir = staging_dir / data_type
+    output_file = output_dir / f"{data_type}.parquet"
+    staging_files = list(staging_type_dir.glob("*.parquet"))
 
-        query = f"""
-        COPY (
-            SELECT {col_select}
-            FROM read_parquet([{files_sql}], union_by_name=true)
-            QUALIFY ROW_NUMBER() OVER (
-                PARTITION BY "{key_col}"
-                ORDER BY modify_date DESC NULLS LAST
-            ) = 1
-        ) TO '{str(temp_output).replace(chr(39), chr(39) * 2)}'
-        (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 500000);
-        """
+    logger.info("Merging {} staging files for {}...", len(staging_files), data_type)
 
-        spill_dir = output_dir / ".duckdb_tmp"
-        spill_dir.mkdir(exist_ok=True)
+    files_to_merge: list[Path] = []
+    if output_file.exists():
+        files_to_merge.append(output_file)
+    files_to_merge.extend(staging_files)
 
-        con = duckdb.connect()
+    # Drop corrupt files so DuckDB doesn't abort the whole merge.
+    valid_files: list[Path] = []
+    for file_path in files_to_merge:
         try:
-            con.execute("SET memory_limit='4GB'")
-            con.execute("SET preserve_insertion_order=false")
-            con.execute("SET threads=2")
-            con.execute(f"SET temp_directory='{spill_dir}'")
-            con.execute(query)
-        finally:
-            con.close()
-
-        if output_file.exists():
-            output_file.unlink()
-        temp_output.rename(output_file)
-
-        total_rows = pq.ParquetFile(output_file).metadata.num_rows
-        logger.info(
-            "{}: merged {:,} deduped rows (key={})",
-            data_type, total_rows, key_col,
+            pq.ParquetFile(file_path)
+        except Exception as e:
+            logger.warning(
+                "{}: skipping corrupt file {}: {}",
+                data_type, file_path.name, e,
+            )
+            continue
+        valid_files.append(file_path)
+
+    if not valid_files:
+        return
+
+    target_columns = list(schema.keys())
+    if key_col is None:
+        raise ValueError(
+            f"merge_staging_files: no dedup key configured for '{data_type}'"
+        )
+    if key_col not in target_columns or "modify_date" not in target_columns:
+        raise ValueError(
+            f"merge_staging_files: schema for '{data_type}' must include "
+            f"'{key_col}' and 'modify_date'"
         )
+
+    temp_output = output_dir / f"{data_type}_merged.parquet"
+
+    # Escape single quotes in paths for inline SQL.
+    files_sql = ", ".join(f"'{str(p).replace(chr(39), chr(39) * 2)}'" for p in valid_files)
+    col_select = ", ".join(f'CAST("{c}" AS VARCHAR) AS "{c}"' for c in target_columns)
+
+    # Row groups close at 500k rows or ~128 MB, whichever comes first, so
+    # wide-text tables (documents with text_content) don't produce row groups
+    # too large for readers to fetch and parallelise over.
+    query = f"""
+    COPY (
+        SELECT {col_select}
+        FROM read_parquet([{files_sql}], union_by_name=true)
+        QUALIFY ROW_NUMBER() OVER (
+            PARTITION BY "{key_col}"
+            ORDER BY modify_date DESC NULLS LAST
+        ) = 1
+    ) TO '{str(temp_output).replace(chr(39), chr(39) * 2)}'
+    (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 500000, ROW_GROUP_SIZE_BYTES '128MB');
+    """
+
+    # One spill directory per data type: concurrent merges must not share
+    # DuckDB's temp files.
+    spill_dir = output_dir / ".duckdb_tmp" / data_type
+    spill_dir.mkdir(parents=True, exist_ok=True)
+
+    con = duckdb.connect()
+    try:
+        con.execute(f"SET memory_limit='{memory_limit_mb}MB'")
+        con.execute("SET preserve_insertion_order=false")
+        con.execute("SET threads=2")
+        con.execute(f"SET temp_directory='{spill_dir}'")
+        con.execute(query)
+    finally:
+        con.close()
+
+    # replace() overwrites atomically: a crash here leaves the previous
+    # output in place rather than no output at all.
+    temp_output.replace(output_file)
+
+    total_rows = pq.ParquetFile(output_file).metadata.num_rows
+    logger.info(
+        "{}: merged {:,} deduped rows (key={})",
+        data_type, total_rows, key_col,
+    )
@@ -3,23 +3,64 @@
 from pathlib import Path
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def _as_str(value):
+    """Stringify a non-str scalar the way polars did (``True`` -> ``"true"``)."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def _column(values: list, arrow_type: pa.DataType) -> pa.Array:
+    # Coerce explicitly rather than via Arrow type inference, which rejects
+    # mixed columns (e.g. ``[1, "s"]``) that polars stored as strings.
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        values = [_as_str(v) for v in values]
+    return pa.array(values, type=arrow_type)
 
 
 def write_staging(
     agency: str,
     data_type: str,
-    records: list[dict],
+    records: list[dict] | dict[str, list],
     staging_dir: Path,
     schema: dict,
 ) -> int:
-    """Write parsed records to a staging Parquet file for one agency/data_type."""
-    if not records:
+    """Write parsed records to a staging Parquet file for one agency/data_type.
+
+    ``records`` is either a list of row dicts or a column mapping of
+    ``{field: [values...]}`` keyed by the schema's fields (as built by
+    :class:`~spicy_regs.sources.StagingWriter`). Each column becomes one
+    Arrow array and the table is written with ``pq.write_table``.
+    """
+    if isinstance(records, dict):
+        row_count = len(next(iter(records.values()), []))
+    else:
+        row_count = len(records)
+    if not row_count:
         return 0
 
     staging_type_dir = staging_dir / data_type
     staging_type_dir.mkdir(parents=True, exist_ok=True)
     staging_file = staging_type_dir / f"{agency}.parquet"
 
-    df = pl.DataFrame(records, schema=schema)
-    df.write_parquet(staging_file, compression="zstd")
-    return len(records)
+    # The schemas are declared as polars dtypes; an empty frame gives their
+    # Arrow equivalents (pl.Utf8 -> large_string) without a hand-kept mapping.
+    arrow_schema = pl.DataFrame(schema=schema).to_arrow().schema
+    if isinstance(records, dict):
+        columns = records
+    else:
+        columns = {name: [r.get(name) for r in records] for name in arrow_schema.names}
+    table = pa.Table.from_arrays(
+        [_column(columns.get(f.name, [None] * row_count), f.type) for f in arrow_schema],
+        schema=arrow_schema,
+    )
+    # Staging files are read back once by the merge on local disk, so favour
+    # the cheaper codec; the merged, published output is zstd.
+    pq.write_table(table, staging_file, compression="snappy")
+    return row_count
@@ -0,0 +1,117 @@
+"""Tests for the spicy-regs CLI (spicy_regs.cli)."""
+
+import argparse
+from pathlib import Path
+
+import httpx
+import polars as pl
+
+from spicy_regs import cli
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestDownloadFile:
+    def test_streams_file_into_place(self, tmp_path: Path) -> None:
+        client = _client(lambda request: httpx.Response(200, content=b"parquet-bytes"))
+
+        result = cli.download_file("dockets", tmp_path, client=client)
+
+        assert result == tmp_path / "dockets.parquet"
+        assert result.read_bytes() == b"parquet-bytes"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_skips_existing_file_without_force(self, tmp_path: Path) -> None:
+        (tmp_path / "dockets.parquet").write_bytes(b"old")
+
+        def fail(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("should not download")
+
+        assert cli.download_file("dockets", tmp_path, client=_client(fail)) == tmp_path / "dockets.parquet"
+        assert (tmp_path / "dockets.parquet").read_bytes() == b"old"
+
+    def test_http_error_leaves_no_file(self, tmp_path: Path) -> None:
+        client = _client(lambda request: httpx.Response(503))
+
+        assert cli.download_file("dockets", tmp_path, client=client) is None
+        assert not (tmp_path / "dockets.parquet").exists()
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_short_body_is_rejected(self, tmp_path: Path) -> None:
+        client = _client(lambda request: httpx.Response(200, headers={"Content-Length": "100"}, content=b"truncated"))
+
+        assert cli.download_file("dockets", tmp_path, client=client) is None
+        assert not (tmp_path / "dockets.parquet").exists()
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_failed_force_download_keeps_existing_file(self, tmp_path: Path) -> None:
+        (tmp_path / "dockets.parquet").write_bytes(b"old")
+        client = _client(lambda request: httpx.Response(404))
+
+        assert cli.download_file("dockets", tmp_path, force=True, client=client) is None
+        assert (tmp_path / "dockets.parquet").read_bytes() == b"old"
+
+
+class TestStats:
+    def test_reports_rows_columns_and_top_agencies(self, tmp_path: Path, capsys, sample_dockets) -> None:
+        pl.DataFrame(sample_dockets).write_parquet(tmp_path / "dockets.parquet")
+
+        cli.cmd_stats(argparse.Namespace(output_dir=str(tmp_path)))
+
+        out = capsys.readouterr().out
+        assert "Rows: 3" in out
+        assert "docket_id" in out
+        assert "EPA: 2" in out
+        assert "FDA: 1" in out
+        assert "DOCUMENTS: Not downloaded yet" in out
+
+
+class TestSample:
+    def test_agency_filter_samples_only_matching_rows(self, tmp_path: Path, capsys, sample_dockets) -> None:
+        pl.DataFrame(sample_dockets).write_parquet(tmp_path / "dockets.parquet")
+
+        cli.cmd_sample(argparse.Namespace(output_dir=str(tmp_path), data_type="dockets", n=5, agency="EPA"))
+
+        out = capsys.readouterr().out
+        assert "(2 total rows)" in out
+        assert "shape: (2," in out
+        assert "FDA" not in out
+
+    def test_sample_size_is_capped_at_row_count(self, tmp_path: Path, capsys, sample_dockets) -> None:
+        pl.DataFrame(sample_dockets).write_parquet(tmp_path / "dockets.parquet")
+
+        cli.cmd_sample(argparse.Namespace(output_dir=str(tmp_path), data_type="dockets", n=2, agency=None))
+
+        out = capsys.readouterr().out
+        assert "(3 total rows)" in out
+        assert "shape: (2," in out
+
+    def test_agency_sample_is_smaller_than_matches(self, tmp_path: Path, capsys, sample_dockets) -> None:
+        pl.DataFrame(sample_dockets).write_parquet(tmp_path / "dockets.parquet")
+
+        cli.cmd_sample(argparse.Namespace(output_dir=str(tmp_path), data_type="dockets", n=1, agency="EPA"))
+
+        out = capsys.readouterr().out
+        assert "(2 total rows)" in out
+        assert "shape: (1," in out
+        assert "FDA" not in out
+
+
+class TestSearch:
+    def test_case_insensitive_match_across_columns(self, tmp_path: Path, capsys, sample_dockets) -> None:
+        pl.DataFrame(sample_dockets).write_parquet(tmp_path / "dockets.parquet")
+
+        cli.cmd_search(argparse.Namespace(output_dir=str(tmp_path), query="DRUG", limit=10))
+
+        out = capsys.readouterr().out
+        assert "DOCKETS: 1 matches" in out
+        assert "FDA-2024-0010: Drug Labeling" in out
+
+    def test_query_is_matched_literally(self, tmp_path: Path, capsys, sample_dockets) -> None:
+        pl.DataFrame(sample_dockets).write_parquet(tmp_path / "dockets.parquet")
+
+        cli.cmd_search(argparse.Namespace(output_dir=str(tmp_path), query="Clean.*", limit=10))
+
+        assert "matches" not in capsys.readouterr().out
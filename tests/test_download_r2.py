@@ -19,12 +19,12 @@ def _fake_stream(*, status_code: int = 200, body: bytes = b"", raise_exc: Except
     """Build a callable that mimics ``httpx.stream(...)`` as a context manager."""
 
     @contextmanager
-    def fake_stream(method, url, follow_redirects=True):
+    def fake_stream(method, url, follow_redirects=True, timeout=None):
         if raise_exc is not None:
             raise raise_exc
         resp = MagicMock()
         resp.status_code = status_code
-        resp.iter_bytes = lambda: iter([body]) if body else iter([])
+        resp.iter_bytes = lambda chunk_size=None: iter([body]) if body else iter([])
         yield resp
 
     return fake_stream
@@ -89,11 +89,11 @@ class TestDownloadFromR2:
         monkeypatch.setenv("R2_PUBLIC_URL", "https://fake.r2.dev")
 
         @contextmanager
-        def dying_stream(method, url, follow_redirects=True):
+        def dying_stream(method, url, follow_redirects=True, timeout=None):
             resp = MagicMock()
             resp.status_code = 200
 
-            def iter_bytes():
+            def iter_bytes(chunk_size=None):
                 yield b"first chunk"
                 raise httpx.ReadError("connection dropped")
 
@@ -127,11 +127,11 @@ class TestDownloadFromR2:
         monkeypatch.setenv("R2_PUBLIC_URL", "https://fake.r2.dev")
 
         @contextmanager
-        def dying_stream(method, url, follow_redirects=True):
+        def dying_stream(method, url, follow_redirects=True, timeout=None):
             resp = MagicMock()
             resp.status_code = 200
 
-            def iter_bytes():
+            def iter_bytes(chunk_size=None):
                 yield b"partial"
                 raise httpx.ReadError("dropped")
 
@@ -1,13 +1,17 @@
 """Tests for the documents PDF-text enrichment step."""
 
 import json
+from pathlib import Path
 
+import httpx
 import polars as pl
 
 from tests.pdf_fixtures import make_pdf, make_textless_pdf
 
+from spicy_regs import enrich_pdf
 from spicy_regs.enrich_pdf import (
     enrich_comments_with_pdf_text,
+    enrich_documents_parquet,
     enrich_documents_with_pdf_text,
     pdf_urls_for_comment,
     pdf_urls_for_document,
@@ -80,6 +84,31 @@ def test_enrich_fills_text_and_status() -> None:
     assert stats == {"selected": 2, "ok": 1, "empty": 1, "encrypted": 0, "error": 0}
 
 
+def test_enrich_parquet_shares_one_client_across_fetches(tmp_path: Path, monkeypatch) -> None:
+    clients: list[httpx.Client] = []
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, content=make_pdf(["Shared pool"]))
+
+    def fake_pdf_client(*, max_connections: int) -> httpx.Client:
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(enrich_pdf, "pdf_client", fake_pdf_client)
+    path = tmp_path / "documents.parquet"
+    _docs_frame().write_parquet(path)
+
+    stats = enrich_documents_parquet(path, max_workers=2)
+
+    assert stats["ok"] == 2
+    assert sorted(requested) == ["https://x/good.pdf", "https://x/scan.pdf"]
+    assert len(clients) == 1
+    assert clients[0].is_closed
+
+
 def test_enrich_records_error_when_fetch_fails() -> None:
     enriched, stats = enrich_documents_with_pdf_text(
         _docs_frame().head(1),
@@ -0,0 +1,140 @@
+"""Tests for the pre-computed analytics JSON (generate_analytics.py)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from spicy_regs.generate_analytics import generate_analytics
+from tests.conftest import COMMENT_SCHEMA, DOCKET_SCHEMA, DOCUMENT_SCHEMA, write_parquet_from_dicts
+
+
+@pytest.fixture
+def parquet_dir(tmp_path: Path, sample_dockets, sample_documents, sample_comments) -> Path:
+    write_parquet_from_dicts(tmp_path / "dockets.parquet", sample_dockets, DOCKET_SCHEMA)
+    write_parquet_from_dicts(tmp_path / "documents.parquet", sample_documents, DOCUMENT_SCHEMA)
+    write_parquet_from_dicts(tmp_path / "comments.parquet", sample_comments, COMMENT_SCHEMA)
+    return tmp_path
+
+
+def _load(outputs: dict[str, Path], name: str) -> list[dict]:
+    return json.loads(outputs[name].read_text())
+
+
+def test_writes_every_analytics_file(parquet_dir: Path) -> None:
+    outputs = generate_analytics(parquet_dir)
+
+    assert set(outputs) == {
+        "statistics",
+        "campaigns",
+        "organizations",
+        "agency_activity",
+        "comment_trends",
+        "cross_agency",
+        "frequent_commenters",
+    }
+    assert all(path.parent == parquet_dir / "analytics" for path in outputs.values())
+
+
+def test_statistics_and_agency_activity(parquet_dir: Path) -> None:
+    outputs = generate_analytics(parquet_dir)
+
+    assert _load(outputs, "statistics") == [
+        {
+            "total_dockets": 3,
+            "total_documents": 2,
+            "total_comments": 4,
+            "top_agency": "EPA",
+            "top_agency_comments": 3,
+        }
+    ]
+    assert _load(outputs, "agency_activity") == [
+        {"agency_code": "EPA", "comment_count": 3, "docket_count": 2},
+        {"agency_code": "FDA", "comment_count": 1, "docket_count": 1},
+    ]
+
+
+def test_comment_trends_by_month(parquet_dir: Path) -> None:
+    outputs = generate_analytics(parquet_dir)
+
+    assert _load(outputs, "comment_trends") == [
+        {"year": 2024, "month": 5, "comment_count": 1},
+        {"year": 2024, "month": 6, "comment_count": 2},
+        {"year": 2024, "month": 7, "comment_count": 1},
+    ]
+
+
+def test_comment_trends_skip_old_and_malformed_dates(tmp_path: Path, sample_dockets, sample_documents) -> None:
+    write_parquet_from_dicts(tmp_path / "dockets.parquet", sample_dockets, DOCKET_SCHEMA)
+    write_parquet_from_dicts(tmp_path / "documents.parquet", sample_documents, DOCUMENT_SCHEMA)
+    comments = [
+        {"comment_id": "C-1", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "posted_date": "2024-06-20"},
+        {"comment_id": "C-2", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "posted_date": "2009-12-31"},
+        {"comment_id": "C-3", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "posted_date": "not-a-date"},
+        {"comment_id": "C-4", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "posted_date": None},
+    ]
+    write_parquet_from_dicts(tmp_path / "comments.parquet", comments, COMMENT_SCHEMA)
+
+    outputs = generate_analytics(tmp_path)
+
+    assert _load(outputs, "comment_trends") == [{"year": 2024, "month": 6, "comment_count": 1}]
+
+
+def test_campaigns_count_duplicate_texts(tmp_path: Path, sample_dockets, sample_documents) -> None:
+    write_parquet_from_dicts(tmp_path / "dockets.parquet", sample_dockets, DOCKET_SCHEMA)
+    write_parquet_from_dicts(tmp_path / "documents.parquet", sample_documents, DOCUMENT_SCHEMA)
+    comments: list[dict[str, str | None]] = [
+        {"comment_id": f"C-{i}", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "comment": "Form letter"}
+        for i in range(1500)
+    ]
+    comments += [
+        {"comment_id": "C-unique", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "comment": "My own words"},
+        {"comment_id": "C-empty", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "comment": None},
+    ]
+    write_parquet_from_dicts(tmp_path / "comments.parquet", comments, COMMENT_SCHEMA)
+
+    outputs = generate_analytics(tmp_path)
+
+    assert _load(outputs, "campaigns") == [
+        {
+            "docket_id": "EPA-2024-0001",
+            "agency_code": "EPA",
+            "total_comments": 1501,
+            "unique_texts": 2,
+            "duplicate_percentage": 99.9,
+        }
+    ]
+
+
+def test_cross_agency_counts_commenting_agencies(tmp_path: Path, sample_dockets, sample_documents) -> None:
+    write_parquet_from_dicts(tmp_path / "dockets.parquet", sample_dockets, DOCKET_SCHEMA)
+    write_parquet_from_dicts(tmp_path / "documents.parquet", sample_documents, DOCUMENT_SCHEMA)
+    comments = [
+        {"comment_id": "C-1", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "title": "Support"},
+        {"comment_id": "C-2", "docket_id": "EPA-2024-0001", "agency_code": "EPA", "title": "Support"},
+        {"comment_id": "C-3", "docket_id": "EPA-2024-0001", "agency_code": "FDA", "title": "Oppose"},
+        {"comment_id": "C-4", "docket_id": "FDA-2024-0010", "agency_code": "FDA", "title": "Support"},
+    ]
+    write_parquet_from_dicts(tmp_path / "comments.parquet", comments, COMMENT_SCHEMA)
+
+    outputs = generate_analytics(tmp_path)
+
+    [row] = _load(outputs, "cross_agency")
+    assert row["docket_id"] == "EPA-2024-0001"
+    assert row["primary_agency"] == "EPA"
+    assert row["commenting_agencies"] == 2
+    assert row["total_comments"] == 3
+
+
+def test_profile_dir_gets_one_profile_per_statement(parquet_dir: Path, tmp_path: Path, capsys) -> None:
+    profiles = tmp_path / "profiles"
+
+    outputs = generate_analytics(parquet_dir, profile_dir=profiles)
+
+    assert {p.stem for p in profiles.glob("*.json")} == {path.stem for path in outputs.values()} | {
+        "load_comments",
+        "comment_groups",
+    }
+    assert not list((parquet_dir / "analytics").glob("*profile*"))
+    # Every profile went to a file; none was dumped to stdout.
+    assert "query_name" not in capsys.readouterr().out
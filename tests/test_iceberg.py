@@ -83,11 +83,22 @@ def test_namespace_empty_defaults(monkeypatch) -> None:
     assert iceberg._namespace() == "custom"
 
 
-def test_connect_raises_when_unconfigured(monkeypatch) -> None:
+def test_connect_raises_when_unconfigured(tmp_path, monkeypatch) -> None:
     for var in iceberg._REQUIRED_ENV:
         monkeypatch.delenv(var, raising=False)
     with pytest.raises(RuntimeError, match="R2_CATALOG_URI"):
-        iceberg._connect()
+        iceberg._connect(tmp_path / ".duckdb_tmp")
+
+
+def test_resource_settings_apply_cleanly(tmp_path) -> None:
+    con = duckdb.connect()
+    spill_dir = tmp_path / "out" / ".duckdb_tmp"
+    iceberg._apply_resource_settings(con, spill_dir)
+    assert con.execute("SELECT current_setting('preserve_insertion_order')").fetchone() == (False,)
+    # DuckDB reports the 4GB (decimal) limit in binary units.
+    assert con.execute("SELECT current_setting('memory_limit')").fetchone() == ("3.7 GiB",)
+    assert con.execute("SELECT current_setting('temp_directory')").fetchone() == (str(spill_dir),)
+    assert spill_dir.is_dir()
 
 
 def test_merge_inserts_then_dedups(tmp_path, local_catalog) -> None:
@@ -397,3 +408,61 @@ def test_seed_comments_tolerates_missing_columns(tmp_path, local_catalog) -> Non
         f"SELECT text_content FROM {iceberg._qualified(COMMENT)} WHERE comment_id = 'old1'"
     ).fetchone()[0]
     assert text_content is None
+
+
+def test_merge_and_export_counts_from_export_not_table(tmp_path, monkeypatch) -> None:
+    """The post-merge row count comes from the exported file's footer, so the
+    remote table is not scanned a second time just to log it."""
+    _write_staging(tmp_path / "s", "EPA", [_docket("EPA-1", "EPA", "T", "2025-01-01")])
+    con = duckdb.connect()
+    con.execute(f"ATTACH ':memory:' AS {iceberg._CATALOG_ALIAS};")
+    executed: list[str] = []
+    real_execute = con.execute
+
+    class _Con:
+        def execute(self, sql, *args, **kwargs):
+            executed.append(sql)
+            return real_execute(sql, *args, **kwargs)
+
+        def close(self):
+            con.close()
+
+    monkeypatch.setattr(iceberg, "_connect", lambda spill_dir: _Con())
+
+    out_file = iceberg.merge_and_export(tmp_path / "s", tmp_path / "out", DOCKET)
+
+    assert out_file is not None and out_file.exists()
+    assert not any(sql.strip().upper().startswith("SELECT COUNT(*)") for sql in executed)
+
+
+def test_merge_comments_counts_from_index_not_table(tmp_path, monkeypatch) -> None:
+    """The post-merge count comes from the rebuilt index, so the comments
+    table — the largest one — is scanned once (for the index), not twice."""
+    _write_comment_staging(
+        tmp_path / "s",
+        "EPA",
+        [
+            _comment("c1", "EPA-1", "EPA", "2025-01-15T00:00:00Z"),
+            _comment("c2", "EPA-1", "EPA", "2025-02-03T00:00:00Z"),
+        ],
+    )
+    con = duckdb.connect()
+    con.execute(f"ATTACH ':memory:' AS {iceberg._CATALOG_ALIAS};")
+    executed: list[str] = []
+    real_execute = con.execute
+
+    class _Con:
+        def execute(self, sql, *args, **kwargs):
+            executed.append(sql)
+            return real_execute(sql, *args, **kwargs)
+
+        def close(self):
+            con.close()
+
+    monkeypatch.setattr(iceberg, "_connect", lambda spill_dir: _Con())
+
+    index_file = iceberg.merge_comments(tmp_path / "s", tmp_path / "out", COMMENT)
+
+    assert index_file is not None
+    assert pl.read_parquet(index_file)["row_count"].sum() == 2
+    assert not any(sql.strip().upper().startswith("SELECT COUNT(*)") for sql in executed)
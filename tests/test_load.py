@@ -31,7 +31,7 @@ class TestUploadShrinkGuard:
         else:
             fake.head_object.return_value = {"ContentLength": remote_size}
 
-        def fake_upload_file(local, bucket, key, ExtraArgs=None):
+        def fake_upload_file(local, bucket, key, ExtraArgs=None, Config=None):
             uploads.append((local, key))
 
         fake.upload_file.side_effect = fake_upload_file
@@ -117,3 +117,116 @@ class TestUploadShrinkGuard:
         with pytest.raises(RuntimeError, match="shrink"):
             upload_to_r2(local)
         assert uploads == []
+
+
+class TestSkipUnchanged:
+    """Uploads skip files whose bytes are already on R2."""
+
+    def _mock_r2_client(self, monkeypatch, head: dict):
+        uploads: list[tuple[str, str, dict]] = []
+        fake = MagicMock()
+        fake.head_object.return_value = head
+        fake.upload_file.side_effect = lambda local, bucket, key, ExtraArgs=None, Config=None: uploads.append(
+            (local, key, ExtraArgs or {})
+        )
+        monkeypatch.setattr(upload_r2, "get_r2_client", lambda: fake)
+        monkeypatch.setenv("R2_ACCESS_KEY_ID", "fake")
+        return uploads
+
+    def _tree(self, tmp_path):
+        local_dir = tmp_path / "comments"
+        part = local_dir / "agency_code=EPA" / "part-0.parquet"
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b"partition-bytes")
+        return local_dir, part
+
+    def test_skips_when_sha256_metadata_matches(self, tmp_path, monkeypatch):
+        local_dir, part = self._tree(tmp_path)
+        _, sha256 = upload_r2._file_digests(part)
+        uploads = self._mock_r2_client(
+            monkeypatch, {"ContentLength": part.stat().st_size, "Metadata": {"sha256": sha256}}
+        )
+
+        upload_r2.upload_directory_to_r2(local_dir)
+
+        assert uploads == []
+
+    def test_skips_when_single_part_etag_matches(self, tmp_path, monkeypatch):
+        local_dir, part = self._tree(tmp_path)
+        md5, _ = upload_r2._file_digests(part)
+        uploads = self._mock_r2_client(monkeypatch, {"ContentLength": part.stat().st_size, "ETag": f'"{md5}"'})
+
+        upload_r2.upload_directory_to_r2(local_dir)
+
+        assert uploads == []
+
+    def test_uploads_changed_file_with_sha256_metadata(self, tmp_path, monkeypatch):
+        local_dir, part = self._tree(tmp_path)
+        uploads = self._mock_r2_client(
+            monkeypatch, {"ContentLength": part.stat().st_size, "ETag": '"0123abcd-2"'}
+        )
+
+        upload_r2.upload_directory_to_r2(local_dir)
+
+        _, sha256 = upload_r2._file_digests(part)
+        assert len(uploads) == 1
+        assert uploads[0][1] == "comments/agency_code=EPA/part-0.parquet"
+        assert uploads[0][2]["Metadata"] == {"sha256": sha256}
+
+    def test_single_file_upload_skips_unchanged_by_default(self, tmp_path, monkeypatch):
+        local = tmp_path / "dockets.parquet"
+        local.write_bytes(b"dockets")
+        _, sha256 = upload_r2._file_digests(local)
+        uploads = self._mock_r2_client(
+            monkeypatch, {"ContentLength": local.stat().st_size, "Metadata": {"sha256": sha256}}
+        )
+
+        upload_to_r2(local)
+        assert uploads == []
+
+        upload_to_r2(local, skip_unchanged=False)
+        assert [key for _, key, _ in uploads] == ["dockets.parquet"]
+
+
+class TestUploadRetry:
+    """A failed transfer is retried with backoff before the error surfaces."""
+
+    def _setup(self, tmp_path, monkeypatch, failures: int):
+        from boto3.exceptions import S3UploadFailedError
+        from botocore.exceptions import ClientError
+
+        attempts: list[str] = []
+        fake = MagicMock()
+        fake.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+        )
+
+        def flaky_upload(local, bucket, key, ExtraArgs=None, Config=None):
+            attempts.append(key)
+            if len(attempts) <= failures:
+                raise S3UploadFailedError("connection reset")
+
+        fake.upload_file.side_effect = flaky_upload
+        monkeypatch.setattr(upload_r2, "get_r2_client", lambda: fake)
+        monkeypatch.setattr(upload_r2.time, "sleep", lambda seconds: None)
+        monkeypatch.setenv("R2_ACCESS_KEY_ID", "fake")
+
+        local = tmp_path / "dockets.parquet"
+        local.write_bytes(b"x" * 100)
+        return local, attempts
+
+    def test_transient_failure_is_retried(self, tmp_path, monkeypatch):
+        local, attempts = self._setup(tmp_path, monkeypatch, failures=2)
+
+        upload_to_r2(local)
+
+        assert len(attempts) == upload_r2.UPLOAD_ATTEMPTS
+
+    def test_gives_up_after_max_attempts(self, tmp_path, monkeypatch):
+        from boto3.exceptions import S3UploadFailedError
+
+        local, attempts = self._setup(tmp_path, monkeypatch, failures=upload_r2.UPLOAD_ATTEMPTS)
+
+        with pytest.raises(S3UploadFailedError):
+            upload_to_r2(local)
+        assert len(attempts) == upload_r2.UPLOAD_ATTEMPTS
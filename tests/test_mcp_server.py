@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import importlib.util
+import threading
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
@@ -241,6 +242,28 @@ def test_sandbox_locks_configuration():
         con.execute("SET allow_unsigned_extensions=true")
 
 
+def test_warm_extensions_failure_is_not_fatal(monkeypatch):
+    """A failed warm-up (offline host) must not keep the server from starting."""
+    executed: list[str] = []
+    closed: list[bool] = []
+
+    class _OfflineConnection:
+        def execute(self, sql):
+            executed.append(sql)
+            if sql.startswith("INSTALL"):
+                raise duckdb.IOException("network unreachable")
+
+        def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr(mcp_server.duckdb, "connect", lambda: _OfflineConnection())
+
+    mcp_server._warm_extensions()
+
+    assert executed[-1] == "INSTALL httpfs"
+    assert closed == [True]
+
+
 @pytest.mark.integration
 def test_connect_queries_r2_end_to_end():
     """Live: the real ``_connect`` (httpfs + R2 views) serves the MCP tools.
@@ -267,3 +290,37 @@ def test_connect_queries_r2_end_to_end():
         )
     )
     assert result is not None
+
+
+def test_build_app_does_not_warm_extensions(monkeypatch):
+    """The serverless entry point must not pay a network INSTALL on cold start."""
+    calls = []
+    monkeypatch.setattr(mcp_server, "_warm_extensions", lambda: calls.append(True))
+
+    mcp_server.build_app()
+
+    assert calls == []
+
+
+def test_main_does_not_wait_for_extension_warm_up(monkeypatch):
+    """A slow first INSTALL must not hold up the stdio handshake."""
+    serving = threading.Event()
+    warmed: list[bool] = []
+
+    class _Server:
+        def run(self):
+            serving.set()
+
+    def slow_warm_up():
+        # Only returns True if the server started while the warm-up was running.
+        warmed.append(serving.wait(5))
+
+    monkeypatch.setattr(mcp_server, "build_server", lambda: _Server())
+    monkeypatch.setattr(mcp_server, "_warm_extensions", slow_warm_up)
+
+    mcp_server.main()
+    for thread in threading.enumerate():
+        if thread.name == "warm-extensions":
+            thread.join(5)
+
+    assert warmed == [True]
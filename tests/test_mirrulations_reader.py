@@ -1,6 +1,7 @@
 """Tests for MirrulationsReader using a fake in-memory S3 resource."""
 
 from json import dumps
+from types import SimpleNamespace
 
 from spicy_regs.schemas import COMMENT, DOCKET, DOCUMENT
 from spicy_regs.sources import MirrulationsReader
@@ -33,39 +34,29 @@ class _FakeBody:
         return self._data
 
 
-class _FakeObj:
-    def __init__(self, key: str, content: bytes) -> None:
-        self.key = key
-        self._content = content
+class _FakePaginator:
+    def __init__(self, store: dict[str, bytes]) -> None:
+        self._store = store
 
-    def get(self) -> dict:
-        return {"Body": _FakeBody(self._content)}
+    def paginate(self, Bucket: str, Prefix: str):  # noqa: N803 — mirrors boto3 kwargs
+        yield {"Contents": [{"Key": key} for key in self._store if key.startswith(Prefix)]}
 
 
-class _FakeObjects:
+class _FakeClient:
     def __init__(self, store: dict[str, bytes]) -> None:
         self._store = store
 
-    def filter(self, Prefix: str):  # noqa: N803 — mirrors boto3 kwarg
-        for key, content in self._store.items():
-            if key.startswith(Prefix):
-                yield _FakeObj(key, content)
+    def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803 — mirrors boto3 kwargs
+        return {"Body": _FakeBody(self._store[Key])}
 
-
-class _FakeBucket:
-    def __init__(self, store: dict[str, bytes]) -> None:
-        self.objects = _FakeObjects(store)
+    def get_paginator(self, operation_name: str) -> _FakePaginator:
+        return _FakePaginator(self._store)
 
 
 class _FakeS3Resource:
     def __init__(self, store: dict[str, bytes]) -> None:
         self._store = store
-
-    def Bucket(self, name: str) -> _FakeBucket:  # noqa: N802 — mirrors boto3 API
-        return _FakeBucket(self._store)
-
-    def Object(self, name: str, key: str) -> _FakeObj:  # noqa: N802 — mirrors boto3 API
-        return _FakeObj(key, self._store[key])
+        self.meta = SimpleNamespace(client=_FakeClient(store))
 
 
 def _docket_key(docket_id: str) -> str:
@@ -126,42 +117,69 @@ def test_iter_records_downloads_concurrently() -> None:
     store = {_docket_key(f"EPA-2024-{i:04d}"): dumps(_docket_payload(f"EPA-2024-{i:04d}")).encode() for i in range(n)}
     barrier = threading.Barrier(n, timeout=5)
 
-    class _BarrierObj(_FakeObj):
-        def get(self) -> dict:
+    class _BarrierClient(_FakeClient):
+        def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
             barrier.wait()  # blocks until all N downloads are concurrently in flight
-            return super().get()
-
-    class _BarrierResource(_FakeS3Resource):
-        def Object(self, name: str, key: str) -> _BarrierObj:  # noqa: N802
-            return _BarrierObj(key, self._store[key])
+            return super().get_object(Bucket=Bucket, Key=Key)
 
-    reader = MirrulationsReader(_BarrierResource(store), BUCKET, PREFIX, AGENCY, DOCKET, download_workers=n)
+    resource = _FakeS3Resource(store)
+    resource.meta = SimpleNamespace(client=_BarrierClient(store))
+    reader = MirrulationsReader(resource, BUCKET, PREFIX, AGENCY, DOCKET, download_workers=n)
     records = list(reader.iter_records())
 
     assert len(records) == n
 
 
-class _CountingObjects(_FakeObjects):
+def test_iter_records_bounds_downloads_in_flight() -> None:
+    """Keys are fed to the pool in a bounded window, not all submitted at once.
+
+    While the consumer sits on the first payload, idle workers may only drain
+    the queued window; with every key submitted up front they would fetch the
+    whole agency.
+    """
+    import threading
+    import time
+
+    from spicy_regs.sources.mirrulations import _IN_FLIGHT_PER_WORKER
+
+    n, workers = 40, 2
+    store = {_docket_key(f"EPA-2024-{i:04d}"): dumps(_docket_payload(f"EPA-2024-{i:04d}")).encode() for i in range(n)}
+    fetched = [0]
+    lock = threading.Lock()
+
+    class _CountingClient(_FakeClient):
+        def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
+            with lock:
+                fetched[0] += 1
+            return super().get_object(Bucket=Bucket, Key=Key)
+
+    resource = _FakeS3Resource(store)
+    resource.meta = SimpleNamespace(client=_CountingClient(store))
+    records = MirrulationsReader(resource, BUCKET, PREFIX, AGENCY, DOCKET, download_workers=workers).iter_records()
+
+    first = next(records)
+    time.sleep(0.2)
+    assert fetched[0] <= workers * _IN_FLIGHT_PER_WORKER + 1
+
+    assert len([first, *records]) == n
+
+
+class _CountingPaginator(_FakePaginator):
     """Counts how many times the agency prefix is scanned."""
 
     def __init__(self, store: dict[str, bytes], scans: list[int]) -> None:
         super().__init__(store)
         self._scans = scans
 
-    def filter(self, Prefix: str):  # noqa: N803 — mirrors boto3 kwarg
+    def paginate(self, Bucket: str, Prefix: str):  # noqa: N803 — mirrors boto3 kwargs
         self._scans[0] += 1
-        return super().filter(Prefix=Prefix)
+        return super().paginate(Bucket=Bucket, Prefix=Prefix)
 
 
 class _CountingResource(_FakeS3Resource):
     def __init__(self, store: dict[str, bytes], scans: list[int]) -> None:
         super().__init__(store)
-        self._scans = scans
-
-    def Bucket(self, name: str):  # noqa: N802
-        bucket = super().Bucket(name)
-        bucket.objects = _CountingObjects(self._store, self._scans)
-        return bucket
+        self.meta.client.get_paginator = lambda operation_name: _CountingPaginator(store, scans)
 
 
 def _typed_store() -> dict[str, bytes]:
@@ -229,3 +247,12 @@ def test_s3_resource_connection_pool_fits_download_workers() -> None:
     pool_size = resource.meta.client.meta.config.max_pool_connections
 
     assert pool_size >= DEFAULT_DOWNLOAD_WORKERS
+
+
+def test_s3_resource_keeps_connections_alive_and_retries_adaptively() -> None:
+    from spicy_regs.sources.mirrulations import s3_resource
+
+    config = s3_resource().meta.client.meta.config
+
+    assert config.tcp_keepalive is True
+    assert config.retries["mode"] == "adaptive"
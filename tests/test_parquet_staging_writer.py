@@ -1,12 +1,15 @@
 """Tests for StagingWriter (Writer connector over write_staging)."""
 
+import json
 from pathlib import Path
 
 import polars as pl
 
-from spicy_regs.schemas import DOCKET
+from spicy_regs.schemas import DOCKET, DOCUMENT
 from spicy_regs.sources import StagingWriter
 
+SAMPLE_DATA = Path(__file__).resolve().parents[1] / "sample-data" / "mirrulations"
+
 
 def test_write_creates_staging_parquet(tmp_output: Path, sample_dockets: list[dict]) -> None:
     staging_dir = tmp_output / "staging"
@@ -41,3 +44,16 @@ def test_write_empty_records_writes_nothing(tmp_output: Path) -> None:
 
     assert writer.rows_written == 0
     assert not (staging_dir / "dockets" / "EPA.parquet").exists()
+
+
+def test_write_stringifies_boolean_withdrawn(tmp_output: Path) -> None:
+    """Real document records carry a JSON boolean ``withdrawn``; it is staged as text."""
+    raw = json.loads((SAMPLE_DATA / "document-ACF-2025-0038-0001.json").read_text())
+    record = DOCUMENT.extract(raw)
+    assert isinstance(record["withdrawn"], bool)
+    staging_dir = tmp_output / "staging"
+
+    StagingWriter("ACF", DOCUMENT, staging_dir).write([record])
+
+    df = pl.read_parquet(staging_dir / "documents" / "ACF.parquet")
+    assert df["withdrawn"].to_list() == [str(record["withdrawn"]).lower()]
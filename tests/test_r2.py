@@ -1,6 +1,10 @@
 """Tests for the R2 storage connector (sources/r2.py)."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -50,3 +54,108 @@ def test_upload_comment_partitions_uploads_changed_and_index(
 
     assert (changed, str(changed.relative_to(tmp_path))) in uploaded
     assert (tmp_path / "comments_index.parquet", "comments_index.parquet") in uploaded
+
+
+def test_upload_comment_partitions_raises_after_other_uploads_finish(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed partition upload is surfaced, but doesn't cancel the rest."""
+    parts = [tmp_path / "comments" / f"part-{i}.parquet" for i in range(4)]
+    parts[0].parent.mkdir(parents=True)
+    for part in parts:
+        part.write_bytes(b"c")
+
+    uploaded: list[Path] = []
+
+    def fake_upload(p, remote_key=None):
+        if p == parts[1]:
+            raise RuntimeError("Refusing to upload: shrink")
+        uploaded.append(p)
+
+    monkeypatch.setattr(r2, "upload_file", fake_upload)
+
+    with pytest.raises(RuntimeError, match="shrink"):
+        r2.upload_comment_partitions(tmp_path, parts)
+    assert set(uploaded) == {parts[0], parts[2], parts[3]}
+
+
+def test_r2_client_is_shared(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every upload reuses one client (and its connection pool)."""
+    monkeypatch.setenv("R2_ENDPOINT", "https://example.r2.cloudflarestorage.com")
+    r2._r2_client.cache_clear()
+    try:
+        client = r2.get_r2_client()
+        assert r2.get_r2_client() is client
+        assert client.meta.config.max_pool_connections >= r2.UPLOAD_WORKERS
+        assert client.meta.config.retries["mode"] == "adaptive"
+    finally:
+        r2._r2_client.cache_clear()
+
+
+def test_list_r2_files_follows_every_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Listings past the first 1,000 keys are not truncated."""
+    pages = [
+        {"Contents": [{"Key": f"comments/part-{i}.parquet", "Size": 1} for i in range(1000)]},
+        {"Contents": [{"Key": "dockets.parquet", "Size": 2}]},
+    ]
+    paginator = MagicMock()
+    paginator.paginate.return_value = iter(pages)
+    client = MagicMock()
+    client.get_paginator.return_value = paginator
+    monkeypatch.setattr(r2, "get_r2_client", lambda: client)
+
+    objects = r2.list_r2_files()
+
+    assert len(objects) == 1001
+    assert objects[-1]["Key"] == "dockets.parquet"
+    client.get_paginator.assert_called_once_with("list_objects_v2")
+
+
+def test_list_r2_files_empty_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    paginator = MagicMock()
+    paginator.paginate.return_value = iter([{"KeyCount": 0}])
+    client = MagicMock()
+    client.get_paginator.return_value = paginator
+    monkeypatch.setattr(r2, "get_r2_client", lambda: client)
+
+    assert r2.list_r2_files() == []
+
+
+def test_upload_dataset_surfaces_upload_failures(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A tripped shrink guard must fail the publish, not be swallowed."""
+    (tmp_path / "dockets.parquet").write_bytes(b"d")
+
+    def refuse(p, remote_key=None):
+        raise RuntimeError("Refusing to upload dockets.parquet: shrink")
+
+    monkeypatch.setattr(r2, "upload_file", refuse)
+
+    with pytest.raises(RuntimeError, match="shrink"):
+        r2.upload_dataset(tmp_path, ["dockets"])
+
+
+def test_upload_dataset_with_nothing_to_publish(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(r2, "upload_file", lambda p, remote_key=None: pytest.fail("nothing to upload"))
+
+    r2.upload_dataset(tmp_path, ["dockets"])
+
+
+def test_r2_client_is_built_once_under_concurrent_first_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Concurrent first calls (upload workers) must not each build a client."""
+    built: list[int] = []
+
+    def slow_client(*args, **kwargs):
+        built.append(threading.get_ident())
+        time.sleep(0.05)
+        return MagicMock()
+
+    monkeypatch.setattr(r2.boto3, "client", slow_client)
+    r2._r2_client.cache_clear()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: r2.get_r2_client(), range(8)))
+    finally:
+        r2._r2_client.cache_clear()
+
+    assert len(built) == 1
+    assert all(c is clients[0] for c in clients)
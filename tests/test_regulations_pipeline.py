@@ -7,6 +7,7 @@ exercises the actual source→transform→sink flow without any network.
 
 from json import dumps
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import polars as pl
@@ -40,39 +41,29 @@ class _FakeBody:
         return self._data
 
 
-class _FakeObj:
-    def __init__(self, key: str, content: bytes) -> None:
-        self.key = key
-        self._content = content
+class _FakePaginator:
+    def __init__(self, store: dict[str, bytes]) -> None:
+        self._store = store
 
-    def get(self) -> dict:
-        return {"Body": _FakeBody(self._content)}
+    def paginate(self, Bucket: str, Prefix: str):  # noqa: N803 — mirrors boto3 kwargs
+        yield {"Contents": [{"Key": key} for key in self._store if key.startswith(Prefix)]}
 
 
-class _FakeObjects:
+class _FakeClient:
     def __init__(self, store: dict[str, bytes]) -> None:
         self._store = store
 
-    def filter(self, Prefix: str):  # noqa: N803 — mirrors boto3 kwarg
-        for key, content in self._store.items():
-            if key.startswith(Prefix):
-                yield _FakeObj(key, content)
-
+    def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803 — mirrors boto3 kwargs
+        return {"Body": _FakeBody(self._store[Key])}
 
-class _FakeBucket:
-    def __init__(self, store: dict[str, bytes]) -> None:
-        self.objects = _FakeObjects(store)
+    def get_paginator(self, operation_name: str) -> _FakePaginator:
+        return _FakePaginator(self._store)
 
 
 class _FakeS3Resource:
     def __init__(self, store: dict[str, bytes]) -> None:
         self._store = store
-
-    def Bucket(self, name: str) -> _FakeBucket:  # noqa: N802 — mirrors boto3 API
-        return _FakeBucket(self._store)
-
-    def Object(self, name: str, key: str) -> _FakeObj:  # noqa: N802 — mirrors boto3 API
-        return _FakeObj(key, self._store[key])
+        self.meta = SimpleNamespace(client=_FakeClient(store))
 
 
 def _docket_payload(docket_id: str, modify_date: str, agency: str = AGENCY) -> dict:
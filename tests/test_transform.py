@@ -18,6 +18,11 @@ from spicy_regs.transforms import (
     write_staging,
 )
 from spicy_regs.schemas import DOCUMENT
+from spicy_regs.transforms.merge_staging_files import (
+    MERGE_MEMORY_LIMIT_MB,
+    MERGE_MIN_MEMORY_MB,
+    _memory_budgets,
+)
 from tests.conftest import (
     COMMENT_SCHEMA,
     DOCKET_SCHEMA,
@@ -49,6 +54,47 @@ class TestWriteStaging:
         assert len(df) == 3
         assert set(df.columns) == set(DOCKET_SCHEMA.keys())
 
+    def test_accepts_column_mapping(self, tmp_path, sample_dockets):
+        staging = tmp_path / "staging"
+        columns = {field: [d.get(field) for d in sample_dockets] for field in DOCKET_SCHEMA}
+        assert write_staging("EPA", "dockets", columns, staging, DOCKET_SCHEMA) == 3
+        df = pl.read_parquet(staging / "dockets" / "EPA.parquet")
+        assert df["docket_id"].to_list() == [d["docket_id"] for d in sample_dockets]
+
+    def test_staging_uses_snappy_and_merge_output_uses_zstd(self, tmp_path, sample_dockets):
+        staging = tmp_path / "staging"
+        write_staging("EPA", "dockets", sample_dockets, staging, DOCKET_SCHEMA)
+        merge_staging_files(staging, tmp_path, ["dockets"], {"dockets": DOCKET_SCHEMA}, {"dockets": "docket_id"})
+
+        def codec(path):
+            return pq.ParquetFile(path).metadata.row_group(0).column(0).compression
+
+        assert codec(staging / "dockets" / "EPA.parquet") == "SNAPPY"
+        assert codec(tmp_path / "dockets.parquet") == "ZSTD"
+
+    def test_non_string_values_are_stored_as_strings(self, tmp_path):
+        records = [{"docket_id": "EPA-1", "title": True}, {"docket_id": "EPA-2", "title": None}]
+        write_staging("EPA", "dockets", records, tmp_path, DOCKET_SCHEMA)
+        df = pl.read_parquet(tmp_path / "dockets" / "EPA.parquet")
+        assert df["title"].to_list() == ["true", None]
+        assert df["agency_code"].null_count() == 2
+
+    def test_mixed_type_columns_are_stored_as_strings(self, tmp_path):
+        records = [
+            {"docket_id": "EPA-1", "title": 1, "abstract": True},
+            {"docket_id": "EPA-2", "title": "s", "abstract": "x"},
+            {"docket_id": "EPA-3", "title": 1.5, "abstract": None},
+        ]
+        write_staging("EPA", "dockets", records, tmp_path, DOCKET_SCHEMA)
+        df = pl.read_parquet(tmp_path / "dockets" / "EPA.parquet")
+        assert df["title"].to_list() == ["1", "s", "1.5"]
+        assert df["abstract"].to_list() == ["true", "x", None]
+
+    def test_returns_zero_for_empty_columns(self, tmp_path):
+        columns = {field: [] for field in DOCKET_SCHEMA}
+        assert write_staging("EPA", "dockets", columns, tmp_path, DOCKET_SCHEMA) == 0
+        assert not (tmp_path / "dockets").exists()
+
 
 class TestMergeStagingFiles:
     def test_merges_multiple_agencies(self, tmp_path, sample_dockets):
@@ -69,6 +115,46 @@ class TestMergeStagingFiles:
         merged = pl.read_parquet(output / "dockets.parquet")
         assert len(merged) == 3
 
+    def test_merges_several_data_types_in_one_call(self, tmp_path, sample_dockets, sample_documents):
+        staging = tmp_path / "staging"
+        output = tmp_path / "output"
+        output.mkdir()
+        write_staging("ALL", "dockets", sample_dockets, staging, DOCKET_SCHEMA)
+        write_staging("ALL", "documents", sample_documents, staging, DOCUMENT_SCHEMA)
+
+        merge_staging_files(
+            staging,
+            output,
+            ["dockets", "documents", "comments"],
+            {"dockets": DOCKET_SCHEMA, "documents": DOCUMENT_SCHEMA, "comments": COMMENT_SCHEMA},
+            {"dockets": "docket_id", "documents": "document_id", "comments": "comment_id"},
+        )
+
+        assert pl.read_parquet(output / "dockets.parquet").height == len(sample_dockets)
+        assert pl.read_parquet(output / "documents.parquet").height == len(sample_documents)
+        assert not (output / "comments.parquet").exists()
+
+    def test_memory_budget_follows_input_size(self):
+        budgets = _memory_budgets({"dockets": 1_000, "documents": 99_000})
+
+        assert budgets["dockets"] < MERGE_MIN_MEMORY_MB + 50
+        assert budgets["documents"] > MERGE_MEMORY_LIMIT_MB - MERGE_MIN_MEMORY_MB - 50
+        assert sum(budgets.values()) <= MERGE_MEMORY_LIMIT_MB
+        assert _memory_budgets({"documents": 5}) == {"documents": MERGE_MEMORY_LIMIT_MB}
+
+    def test_memory_budget_never_drops_below_floor(self):
+        many = {f"type{i}": 1_000 * (i + 1) for i in range(40)}
+
+        assert min(_memory_budgets(many).values()) >= MERGE_MIN_MEMORY_MB
+        assert min(_memory_budgets(dict.fromkeys(many, 0)).values()) >= MERGE_MIN_MEMORY_MB
+
+    def test_missing_dedup_key_raises(self, tmp_path, sample_dockets):
+        staging = tmp_path / "staging"
+        write_staging("EPA", "dockets", sample_dockets, staging, DOCKET_SCHEMA)
+
+        with pytest.raises(ValueError, match="no dedup key"):
+            merge_staging_files(staging, tmp_path, ["dockets"], {"dockets": DOCKET_SCHEMA}, {})
+
     def test_appends_to_existing_output(self, tmp_path, sample_dockets):
         staging = tmp_path / "staging"
         output = tmp_path / "output"